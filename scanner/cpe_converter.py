@@ -5,8 +5,186 @@ Converts system information to CPE 2.3 format.
 CPE 2.3 format: cpe:2.3:part:vendor:product:version:update:edition:language:sw_edition:target_sw:target_hw:other
 Part values: a = application, o = operating system, h = hardware device
 """
+import functools
 import re
 import platform
+from collections import namedtuple
+
+# Optional C-accelerated multi-pattern matcher for vendor keyword lookups
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Characters allowed as-is in a sanitized CPE value
+_CPE_ALLOWED_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789._-'
+_CPE_ALLOWED_SET = frozenset(_CPE_ALLOWED_CHARS)
+
+
+# A single converted CPE entry; field order matches the report columns
+CPEEntry = namedtuple('CPEEntry', ['type', 'name', 'vendor', 'product', 'version', 'cpe'])
+
+
+class _SanitizeTable(dict):
+    """
+    str.translate() table mapping every character outside the allowed
+    CPE set to an underscore, including code points above 255.
+    """
+    
+    def __missing__(self, codepoint):
+        self[codepoint] = '_'
+        return '_'
+
+
+_SANITIZE_TABLE = _SanitizeTable({ord(c): c for c in _CPE_ALLOWED_CHARS})
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize(value):
+    """
+    Sanitize a string for use in CPE format.
+    Results are memoized since the same vendor/product names and '*'
+    placeholders are sanitized over and over during a conversion.
+    """
+    if not value or value == 'Unknown':
+        return '*'
+    
+    # Convert to lowercase and replace spaces and special characters
+    # with underscores in a single pass
+    value = value.lower().translate(_SANITIZE_TABLE)
+    
+    # Remove leading/trailing underscores
+    value = value.strip('_')
+    
+    # Replace multiple underscores with single
+    while '__' in value:
+        value = value.replace('__', '_')
+    
+    return value if value else '*'
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_format_version(version):
+    """Format a version string for CPE (memoized)."""
+    if not version or version == 'Unknown':
+        return '*'
+    
+    # Remove common prefixes
+    if version[:1] in ('v', 'V'):
+        version = version[1:]
+    
+    # Sanitize for CPE
+    return _sanitize(version)
+
+
+def _format_gb(size_bytes):
+    """Format a byte count from the hardware scan as GB with two decimals."""
+    return round(size_bytes / (1 << 30), 2)
+
+
+def _trie_pattern(keywords):
+    """
+    Build a regex source string matching exactly the given keywords.
+    
+    The keywords are inserted into a character trie which is emitted as
+    nested alternations, so keywords sharing a prefix share one branch
+    (e.g. 'node' and 'nodejs' become 'node(?:js)?'). The regex engine
+    then walks each candidate position in time proportional to the
+    length of the match rather than the number of keywords.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True  # end-of-keyword marker
+    
+    def emit(node):
+        branches = [re.escape(char) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+    
+    return emit(trie)
+
+
+class _KeywordMatcher:
+    """
+    Find the first keyword of an ordered mapping contained in a string.
+    
+    Keywords are prioritized by their position in the mapping, so the
+    result is the same as a linear `for key in mapping: if key in text`
+    scan. With pyahocorasick installed all keywords are matched in a
+    single pass over the text; otherwise a precompiled trie-shaped regex
+    locates a candidate and only higher-priority keywords are rechecked.
+    Lookups are memoized on the original text and lowercase it only on a
+    cache miss, since device and package names repeat often.
+    """
+    
+    def __init__(self, mapping, cache_size=512):
+        self.search = functools.lru_cache(maxsize=cache_size)(self._search)
+        self._items = list(mapping.items())
+        self._priority = {keyword: i for i, (keyword, _) in enumerate(self._items)}
+        self._automaton = None
+        self._pattern = None
+        
+        if not self._items:
+            return
+        
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for priority, (keyword, value) in enumerate(self._items):
+                automaton.add_word(keyword, (priority, value))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._pattern = re.compile(_trie_pattern(keyword for keyword, _ in self._items))
+    
+    def _search(self, text, default=None):
+        """
+        Return the value of the highest-priority keyword found in text.
+        Called through the memoized `search` attribute.
+        
+        Args:
+            text: String to search (matched case-insensitively)
+            default: Value returned when no keyword matches
+        
+        Returns:
+            The mapped value of the matching keyword, or default
+        """
+        text = text.lower()
+        
+        if self._automaton is not None:
+            best = None
+            for _, match in self._automaton.iter(text):
+                if best is None or match[0] < best[0]:
+                    best = match
+                    if best[0] == 0:
+                        break
+            return best[1] if best else default
+        
+        if self._pattern is None:
+            return default
+        
+        match = self._pattern.search(text)
+        if not match:
+            return default
+        
+        # The leftmost match is not necessarily the highest-priority
+        # keyword, so check the ones ranked before it
+        priority = self._priority[match.group(0)]
+        for keyword, value in self._items[:priority]:
+            if keyword in text:
+                return value
+        
+        return self._items[priority][1]
 
 
 class CPEConverter:
@@ -44,6 +222,62 @@ class CPEConverter:
         'darwin': ('apple', 'macos'),
     }
     
+    # Hardware vendor name mappings
+    _VENDOR_KEYWORDS = {
+        'intel': 'intel',
+        'amd': 'amd',
+        'nvidia': 'nvidia',
+        'realtek': 'realtek',
+        'broadcom': 'broadcom',
+        'qualcomm': 'qualcomm',
+        'marvell': 'marvell',
+        'samsung': 'samsung',
+        'western digital': 'western_digital',
+        'seagate': 'seagate',
+        'sandisk': 'sandisk',
+        'kingston': 'kingston',
+        'corsair': 'corsair',
+        'asus': 'asus',
+        'msi': 'msi',
+        'gigabyte': 'gigabyte',
+        'asrock': 'asrock',
+        'dell': 'dell',
+        'hp': 'hp',
+        'lenovo': 'lenovo',
+        'acer': 'acer',
+        'apple': 'apple',
+        'microsoft': 'microsoft',
+        'logitech': 'logitech',
+        'razer': 'razer',
+        'creative': 'creative',
+        'conexant': 'conexant',
+        'via': 'via',
+        'linux foundation': 'linux',
+    }
+    
+    # Product/brand names that map to their parent vendor
+    _PRODUCT_TO_VENDOR = {
+        'ati': 'amd',       # ATI is now AMD
+        'radeon': 'amd',   # Radeon is AMD product line
+        'geforce': 'nvidia',  # GeForce is NVIDIA product line
+    }
+    
+    # Device lists converted by convert_hardware, in output order:
+    # (hardware_info key, default name, type field, default type,
+    #  vendor fields, version field)
+    _HW_DEVICE_SPECS = (
+        ('gpu', 'Unknown GPU', None, 'GPU', (), 'driver_version'),
+        ('audio', 'Unknown Audio Device', None, 'Audio', (), None),
+        ('usb', 'Unknown USB Device', 'type', 'USB Device', (), None),
+        ('pci', 'Unknown PCI Device', 'device_class', 'PCI Device', (), None),
+        ('system_devices', 'Unknown System Device', 'type', 'System Device',
+         ('manufacturer', 'vendor'), 'version'),
+    )
+    
+    # Matchers over the vendor tables, built once per class
+    _VENDOR_MATCHER = _KeywordMatcher(VENDOR_MAPPINGS)
+    _HARDWARE_VENDOR_MATCHER = _KeywordMatcher({**_VENDOR_KEYWORDS, **_PRODUCT_TO_VENDOR})
+    
     def __init__(self):
         self.cpe_list = []
     
@@ -52,42 +286,29 @@ class CPEConverter:
         Sanitize a value for use in CPE format.
         Replace special characters and spaces with underscores.
         """
-        if not value or value == 'Unknown':
+        if not value or value == 'Unknown' or value == '*':
             return '*'
         
-        # Convert to lowercase
-        value = str(value).lower()
-        
-        # Replace spaces and special characters with underscores
-        value = re.sub(r'[^a-z0-9._-]', '_', value)
+        # Fast path: value is already a clean CPE component
+        if (isinstance(value, str) and not (set(value) - _CPE_ALLOWED_SET)
+                and value[0] != '_' and value[-1] != '_' and '__' not in value):
+            return value
         
-        # Remove leading/trailing underscores
-        value = value.strip('_')
-        
-        # Replace multiple underscores with single
-        value = re.sub(r'_+', '_', value)
-        
-        return value if value else '*'
+        return _sanitize(str(value))
     
     def _format_version(self, version):
         """Format version string for CPE."""
         if not version or version == 'Unknown':
             return '*'
         
-        # Extract version numbers
-        version = str(version)
-        
-        # Remove common prefixes
-        version = re.sub(r'^[vV]', '', version)
-        
-        # Sanitize for CPE
-        return self._sanitize_cpe_value(version)
+        return _cached_format_version(str(version))
     
     def _generate_cpe(self, part, vendor, product, version='*', update='*', 
                       edition='*', language='*', sw_edition='*', 
                       target_sw='*', target_hw='*', other='*'):
         """
         Generate a CPE 2.3 formatted string.
+        All components are sanitized here, so callers pass raw values.
         
         Args:
             part: 'a' for application, 'o' for OS, 'h' for hardware
@@ -105,32 +326,34 @@ class CPEConverter:
         Returns:
             CPE 2.3 formatted string
         """
-        components = [
-            'cpe', '2.3', part,
-            self._sanitize_cpe_value(vendor),
-            self._sanitize_cpe_value(product),
-            self._format_version(version),
-            self._sanitize_cpe_value(update),
-            self._sanitize_cpe_value(edition),
-            self._sanitize_cpe_value(language),
-            self._sanitize_cpe_value(sw_edition),
-            self._sanitize_cpe_value(target_sw),
-            self._sanitize_cpe_value(target_hw),
-            self._sanitize_cpe_value(other),
-        ]
-        
-        return ':'.join(components)
+        san = self._sanitize_cpe_value
+        fv = self._format_version
+        
+        return (f"cpe:2.3:{part}:{san(vendor)}:{san(product)}:{fv(version)}:"
+                f"{san(update)}:{san(edition)}:{san(language)}:{san(sw_edition)}:"
+                f"{san(target_sw)}:{san(target_hw)}:{san(other)}")
+    
+    def _generate_cpe_fast(self, part, vendor, product, version='*'):
+        """
+        Generate a CPE 2.3 formatted string from pre-sanitized components.
+        
+        Callers must guarantee that vendor, product and version are already
+        valid CPE values; no sanitization is applied and all remaining
+        attributes are '*'.
+        
+        Returns:
+            CPE 2.3 formatted string
+        """
+        return f"cpe:2.3:{part}:{vendor}:{product}:{version}:*:*:*:*:*:*:*"
     
     def _get_vendor_from_name(self, name, vendor_hint=None):
         """Try to determine vendor from product name or hint."""
         if vendor_hint and vendor_hint != 'Unknown':
             return vendor_hint
         
-        name_lower = name.lower()
-        
-        for key, vendor in self.VENDOR_MAPPINGS.items():
-            if key in name_lower:
-                return vendor
+        vendor = self._VENDOR_MATCHER.search(name)
+        if vendor:
+            return vendor
         
         # If no match found, use first word as vendor
         first_word = name.split()[0] if name else 'unknown'
@@ -144,7 +367,7 @@ class CPEConverter:
             os_info: Dictionary containing OS information
         
         Returns:
-            CPE formatted string for the OS
+            CPEEntry for the OS
         """
         system = os_info.get('system', 'Unknown').lower()
         
@@ -182,14 +405,14 @@ class CPEConverter:
             target_hw=os_info.get('machine', '*')
         )
         
-        return {
-            'type': 'Operating System',
-            'name': os_info.get('platform', f"{system} {version}"),
-            'vendor': vendor,
-            'product': product,
-            'version': version,
-            'cpe': cpe,
-        }
+        return CPEEntry(
+            type='Operating System',
+            name=os_info.get('platform', f"{system} {version}"),
+            vendor=vendor,
+            product=product,
+            version=version,
+            cpe=cpe,
+        )
     
     def convert_hardware(self, hardware_info):
         """
@@ -199,14 +422,14 @@ class CPEConverter:
             hardware_info: Dictionary containing hardware information
         
         Returns:
-            List of CPE formatted dictionaries for hardware
+            List of CPEEntry tuples for hardware
         """
         cpe_list = []
         
         # CPU
         cpu_info = hardware_info.get('cpu', {})
         if cpu_info:
-            cpu_model = cpu_info.get('model', cpu_info.get('processor', 'Unknown'))
+            cpu_model = cpu_info['model'] if 'model' in cpu_info else cpu_info.get('processor', 'Unknown')
             
             # Try to determine vendor
             vendor = 'unknown'
@@ -221,180 +444,99 @@ class CPEConverter:
             cpe = self._generate_cpe(
                 part='h',
                 vendor=vendor,
-                product=self._sanitize_cpe_value(cpu_model),
+                product=cpu_model,
                 version='*',
             )
             
-            cpe_list.append({
-                'type': 'Hardware - CPU',
-                'name': cpu_model,
-                'vendor': vendor,
-                'product': cpu_model,
-                'version': '*',
-                'cpe': cpe,
-            })
+            cpe_list.append(CPEEntry(
+                type='Hardware - CPU',
+                name=cpu_model,
+                vendor=vendor,
+                product=cpu_model,
+                version='*',
+                cpe=cpe,
+            ))
         
         # Memory (generic hardware entry)
+        # Vendor, product and the numeric size version are already valid
+        # CPE values, so these entries skip sanitization
         memory_info = hardware_info.get('memory', {})
-        if memory_info and 'total_gb' in memory_info:
-            cpe = self._generate_cpe(
-                part='h',
+        total_bytes = memory_info.get('total_bytes')
+        if total_bytes is not None:
+            total_gb = _format_gb(total_bytes)
+            version = f"{total_gb}gb"
+            cpe = self._generate_cpe_fast('h', 'generic', 'memory', version)
+            
+            cpe_list.append(CPEEntry(
+                type='Hardware - Memory',
+                name=f"System Memory ({total_gb} GB)",
                 vendor='generic',
                 product='memory',
-                version=f"{memory_info['total_gb']}gb",
-            )
-            
-            cpe_list.append({
-                'type': 'Hardware - Memory',
-                'name': f"System Memory ({memory_info['total_gb']} GB)",
-                'vendor': 'generic',
-                'product': 'memory',
-                'version': f"{memory_info['total_gb']}gb",
-                'cpe': cpe,
-            })
+                version=version,
+                cpe=cpe,
+            ))
         
         # Disks
         disks = hardware_info.get('disks', [])
         for i, disk in enumerate(disks):
             if 'error' not in disk:
-                device_name = disk.get('device', f'disk{i}')
-                cpe = self._generate_cpe(
-                    part='h',
+                device_name = disk['device'] if 'device' in disk else f'disk{i}'
+                total_bytes = disk.get('total_bytes')
+                if total_bytes is None:
+                    version, size = '0gb', 'Unknown'
+                else:
+                    total_gb = _format_gb(total_bytes)
+                    version, size = f"{total_gb}gb", total_gb
+                cpe = self._generate_cpe_fast('h', 'generic', 'storage', version)
+                
+                cpe_list.append(CPEEntry(
+                    type='Hardware - Storage',
+                    name=f"{device_name} ({size} GB)",
                     vendor='generic',
                     product='storage',
-                    version=f"{disk.get('total_gb', 0)}gb",
-                )
-                
-                cpe_list.append({
-                    'type': 'Hardware - Storage',
-                    'name': f"{device_name} ({disk.get('total_gb', 'Unknown')} GB)",
-                    'vendor': 'generic',
-                    'product': 'storage',
-                    'version': f"{disk.get('total_gb', 0)}gb",
-                    'cpe': cpe,
-                })
-        
-        # GPU/Display Adapters
-        gpus = hardware_info.get('gpu', [])
-        for gpu in gpus:
-            if 'error' not in gpu:
-                gpu_name = gpu.get('name', 'Unknown GPU')
-                vendor = self._detect_hardware_vendor(gpu_name)
-                version = gpu.get('driver_version', '*')
-                
-                cpe = self._generate_cpe(
-                    part='h',
-                    vendor=vendor,
-                    product=self._sanitize_cpe_value(gpu_name),
                     version=version,
-                )
+                    cpe=cpe,
+                ))
+        
+        # GPU, audio, USB, PCI and system devices (BIOS, Motherboard, etc.)
+        detect_vendor = self._detect_hardware_vendor
+        generate_cpe = self._generate_cpe
+        
+        for (src_key, default_name, type_field, default_type,
+             vendor_fields, version_field) in self._HW_DEVICE_SPECS:
+            for device in hardware_info.get(src_key, []):
+                if 'error' in device:
+                    continue
                 
-                cpe_list.append({
-                    'type': 'Hardware - GPU',
-                    'name': gpu_name,
-                    'vendor': vendor,
-                    'product': gpu_name,
-                    'version': version,
-                    'cpe': cpe,
-                })
-        
-        # Audio Devices
-        audio_devices = hardware_info.get('audio', [])
-        for audio in audio_devices:
-            if 'error' not in audio:
-                audio_name = audio.get('name', 'Unknown Audio Device')
-                vendor = self._detect_hardware_vendor(audio_name)
+                device_name = device.get('name', default_name)
+                device_type = device.get(type_field, default_type) if type_field else default_type
                 
-                cpe = self._generate_cpe(
-                    part='h',
-                    vendor=vendor,
-                    product=self._sanitize_cpe_value(audio_name),
-                    version='*',
-                )
-                
-                cpe_list.append({
-                    'type': 'Hardware - Audio',
-                    'name': audio_name,
-                    'vendor': vendor,
-                    'product': audio_name,
-                    'version': '*',
-                    'cpe': cpe,
-                })
-        
-        # USB Devices
-        usb_devices = hardware_info.get('usb', [])
-        for usb in usb_devices:
-            if 'error' not in usb:
-                usb_name = usb.get('name', 'Unknown USB Device')
-                vendor = self._detect_hardware_vendor(usb_name)
-                device_type = usb.get('type', 'USB Device')
-                
-                cpe = self._generate_cpe(
-                    part='h',
-                    vendor=vendor,
-                    product=self._sanitize_cpe_value(usb_name),
-                    version='*',
-                )
+                # Prefer a vendor reported by the device itself
+                vendor = ''
+                for field in vendor_fields:
+                    if field in device:
+                        vendor = device[field]
+                        break
+                if not vendor:
+                    vendor = detect_vendor(device_name)
                 
-                cpe_list.append({
-                    'type': f'Hardware - {device_type}',
-                    'name': usb_name,
-                    'vendor': vendor,
-                    'product': usb_name,
-                    'version': '*',
-                    'cpe': cpe,
-                })
-        
-        # PCI Devices
-        pci_devices = hardware_info.get('pci', [])
-        for pci in pci_devices:
-            if 'error' not in pci:
-                pci_name = pci.get('name', 'Unknown PCI Device')
-                vendor = self._detect_hardware_vendor(pci_name)
-                device_class = pci.get('device_class', 'PCI Device')
+                version = device.get(version_field, '*') if version_field else '*'
                 
-                cpe = self._generate_cpe(
+                cpe = generate_cpe(
                     part='h',
                     vendor=vendor,
-                    product=self._sanitize_cpe_value(pci_name),
-                    version='*',
+                    product=device_name,
+                    version=version,
                 )
                 
-                cpe_list.append({
-                    'type': f'Hardware - {device_class}',
-                    'name': pci_name,
-                    'vendor': vendor,
-                    'product': pci_name,
-                    'version': '*',
-                    'cpe': cpe,
-                })
-        
-        # System Devices (BIOS, Motherboard, etc.)
-        system_devices = hardware_info.get('system_devices', [])
-        for device in system_devices:
-            if 'error' not in device:
-                device_name = device.get('name', 'Unknown System Device')
-                device_type = device.get('type', 'System Device')
-                vendor = device.get('manufacturer', device.get('vendor', ''))
-                if not vendor:
-                    vendor = self._detect_hardware_vendor(device_name)
-                version = device.get('version', '*')
-                
-                cpe = self._generate_cpe(
-                    part='h',
+                cpe_list.append(CPEEntry(
+                    type=f'Hardware - {device_type}',
+                    name=device_name,
                     vendor=vendor,
-                    product=self._sanitize_cpe_value(device_name),
+                    product=device_name,
                     version=version,
-                )
-                
-                cpe_list.append({
-                    'type': f'Hardware - {device_type}',
-                    'name': device_name,
-                    'vendor': vendor,
-                    'product': device_name,
-                    'version': version,
-                    'cpe': cpe,
-                })
+                    cpe=cpe,
+                ))
         
         return cpe_list
     
@@ -403,59 +545,9 @@ class CPEConverter:
         if not name:
             return 'unknown'
         
-        name_lower = name.lower()
-        
-        # Direct vendor name mappings
-        vendor_keywords = {
-            'intel': 'intel',
-            'amd': 'amd',
-            'nvidia': 'nvidia',
-            'realtek': 'realtek',
-            'broadcom': 'broadcom',
-            'qualcomm': 'qualcomm',
-            'marvell': 'marvell',
-            'samsung': 'samsung',
-            'western digital': 'western_digital',
-            'seagate': 'seagate',
-            'sandisk': 'sandisk',
-            'kingston': 'kingston',
-            'corsair': 'corsair',
-            'asus': 'asus',
-            'msi': 'msi',
-            'gigabyte': 'gigabyte',
-            'asrock': 'asrock',
-            'dell': 'dell',
-            'hp': 'hp',
-            'lenovo': 'lenovo',
-            'acer': 'acer',
-            'apple': 'apple',
-            'microsoft': 'microsoft',
-            'logitech': 'logitech',
-            'razer': 'razer',
-            'creative': 'creative',
-            'conexant': 'conexant',
-            'via': 'via',
-            'linux foundation': 'linux',
-        }
-        
-        # Product/brand names that map to their parent vendor
-        product_to_vendor = {
-            'ati': 'amd',       # ATI is now AMD
-            'radeon': 'amd',   # Radeon is AMD product line
-            'geforce': 'nvidia',  # GeForce is NVIDIA product line
-        }
-        
-        # Check direct vendor keywords first
-        for keyword, vendor in vendor_keywords.items():
-            if keyword in name_lower:
-                return vendor
-        
-        # Check product-to-vendor mappings
-        for product, vendor in product_to_vendor.items():
-            if product in name_lower:
-                return vendor
-        
-        return 'unknown'
+        # Direct vendor keywords take precedence over product-to-vendor
+        # mappings, as encoded by their order in the matcher
+        return self._HARDWARE_VENDOR_MATCHER.search(name, 'unknown')
     
     def convert_software(self, software_list):
         """
@@ -465,39 +557,45 @@ class CPEConverter:
             software_list: List of software dictionaries
         
         Returns:
-            List of CPE formatted dictionaries for software
+            List of CPEEntry tuples for software
         """
-        cpe_list = []
+        return list(self.convert_software_iter(software_list))
+    
+    def convert_software_iter(self, software_iter):
+        """
+        Convert software items to CPE format one at a time, so conversion
+        can overlap with a scan that is still producing them.
+        
+        Args:
+            software_iter: Iterable of software dictionaries
         
-        for software in software_list:
+        Yields:
+            CPEEntry tuples for software (error entries are skipped)
+        """
+        get_vendor = self._get_vendor_from_name
+        san = self._sanitize_cpe_value
+        fv = self._format_version
+        # Software CPEs only set vendor, product and version, so sanitizing
+        # those three and filling in the '*' attributes directly gives the
+        # same string as _generate_cpe() without its eight further calls
+        generate_cpe = self._generate_cpe_fast
+        
+        for software in software_iter:
             if 'error' in software:
                 continue
-            
             name = software.get('name', 'Unknown')
+            vendor = get_vendor(name, software.get('vendor', 'Unknown'))
             version = software.get('version', '*')
-            vendor_hint = software.get('vendor', 'Unknown')
-            
-            vendor = self._get_vendor_from_name(name, vendor_hint)
-            
-            cpe = self._generate_cpe(
-                part='a',
-                vendor=vendor,
-                product=self._sanitize_cpe_value(name),
-                version=version,
+            yield CPEEntry(
+                f"Software ({software.get('type', 'unknown')})",
+                name,
+                vendor,
+                name,
+                version,
+                generate_cpe('a', san(vendor), san(name), fv(version)),
             )
-            
-            cpe_list.append({
-                'type': f"Software ({software.get('type', 'unknown')})",
-                'name': name,
-                'vendor': vendor,
-                'product': name,
-                'version': version,
-                'cpe': cpe,
-            })
-        
-        return cpe_list
     
-    def convert_all(self, os_info, hardware_info, software_list):
+    def convert_all(self, os_info, hardware_info, software_list, software_cpe=None):
         """
         Convert all system information to CPE format.
         
@@ -505,9 +603,11 @@ class CPEConverter:
             os_info: Dictionary containing OS information
             hardware_info: Dictionary containing hardware information
             software_list: List of software dictionaries
+            software_cpe: CPEEntry tuples already converted from
+                software_list with convert_software_iter(), if any
         
         Returns:
-            List of all CPE formatted dictionaries
+            List of all CPEEntry tuples
         """
         self.cpe_list = []
         
@@ -518,6 +618,8 @@ class CPEConverter:
         self.cpe_list.extend(self.convert_hardware(hardware_info))
         
         # Convert Software
-        self.cpe_list.extend(self.convert_software(software_list))
+        if software_cpe is None:
+            software_cpe = self.convert_software(software_list)
+        self.cpe_list.extend(software_cpe)
         
         return self.cpe_list
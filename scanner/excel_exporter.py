@@ -55,7 +55,7 @@ class ExcelExporter:
         Export CPE data to an Excel file.
         
         Args:
-            cpe_data: List of CPE formatted dictionaries
+            cpe_data: List of CPEEntry tuples
             output_file: Output file path
         
         Returns:
@@ -98,10 +98,9 @@ class ExcelExporter:
         for row, item in enumerate(cpe_data, 2):
             row_had_illegal_chars = False
             
-            # Sanitize and write each field
-            fields = ['type', 'name', 'vendor', 'product', 'version', 'cpe']
-            for col, field in enumerate(fields, 1):
-                value, had_illegal = self._sanitize_value(item.get(field, ''))
+            # Sanitize and write each field (CPEEntry order matches the columns)
+            for col, field_value in enumerate(item, 1):
+                value, had_illegal = self._sanitize_value(field_value)
                 if had_illegal:
                     row_had_illegal_chars = True
                 ws.cell(row=row, column=col, value=value).border = thin_border
@@ -149,7 +148,7 @@ class ExcelExporter:
         # Count by type
         type_counts = {}
         for item in cpe_data:
-            item_type = item.get('type', 'Unknown')
+            item_type = item.type
             # Simplify type names
             if 'Operating System' in item_type:
                 category = 'Operating System'
@@ -192,7 +191,7 @@ class ExcelExporter:
             os_info: Dictionary containing OS information
             hardware_info: Dictionary containing hardware information
             software_list: List of software dictionaries
-            cpe_data: List of CPE formatted dictionaries
+            cpe_data: List of CPEEntry tuples
             output_file: Output file path
         
         Returns:
@@ -245,10 +244,9 @@ class ExcelExporter:
         for row, item in enumerate(cpe_data, 2):
             row_had_illegal_chars = False
             
-            # Sanitize and write each field
-            fields = ['type', 'name', 'vendor', 'product', 'version', 'cpe']
-            for col, field in enumerate(fields, 1):
-                value, had_illegal = self._sanitize_value(item.get(field, ''))
+            # Sanitize and write each field (CPEEntry order matches the columns)
+            for col, field_value in enumerate(item, 1):
+                value, had_illegal = self._sanitize_value(field_value)
                 if had_illegal:
                     row_had_illegal_chars = True
                 ws.cell(row=row, column=col, value=value)
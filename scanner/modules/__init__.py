@@ -1,6 +1,25 @@
 # Scanner modules package
-from .os_scanner import OSScanner
-from .hardware_scanner import HardwareScanner
-from .software_scanner import SoftwareScanner
+import importlib
 
 __all__ = ['OSScanner', 'HardwareScanner', 'SoftwareScanner']
+
+# Submodule defining each exported scanner; a scanner's module is imported
+# the first time the scanner is used, so e.g. --skip-software never loads
+# the software scanner
+_SCANNER_MODULES = {
+    'OSScanner': '.os_scanner',
+    'HardwareScanner': '.hardware_scanner',
+    'SoftwareScanner': '.software_scanner',
+}
+
+
+def __getattr__(name):
+    if name not in _SCANNER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_SCANNER_MODULES[name], __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
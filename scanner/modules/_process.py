@@ -0,0 +1,61 @@
+"""
+Subprocess helpers shared by the scanner modules.
+"""
+import os
+import signal
+import subprocess
+import threading
+
+
+def iter_lines(cmd, timeout, check=True):
+    """
+    Run an external command and yield its output lines as they are
+    written, so parsing overlaps with the command still running instead
+    of waiting for all of its output first. stderr is discarded.
+    
+    Args:
+        cmd: Command and arguments
+        timeout: Seconds before the command is killed
+        check: Raise subprocess.CalledProcessError after the last line if
+            the command exited with a non-zero status (the default; its
+            output is then likely partial or empty)
+    
+    Raises:
+        FileNotFoundError: The command is not installed
+        subprocess.TimeoutExpired: The command was killed after timeout
+            seconds (the lines read until then have been yielded)
+    """
+    posix = os.name == 'posix'
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1,
+        start_new_session=posix
+    )
+    # Reading stdout blocks, so a timer enforces the timeout by killing
+    # the command, which ends the output. On POSIX its whole process
+    # group is killed, as a child left running would keep stdout open.
+    expired = []
+    def expire():
+        expired.append(True)
+        try:
+            if posix:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            pass  # Already exited
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    timer.start()
+    try:
+        for line in process.stdout:
+            yield line.rstrip('\n')
+    finally:
+        timer.cancel()
+        if process.poll() is None:
+            process.kill()  # The caller stopped reading early
+        process.stdout.close()
+        process.wait()
+    if expired:
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if check and process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
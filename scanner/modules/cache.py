@@ -0,0 +1,65 @@
+"""
+Scan Cache Module
+Keeps scan results on disk between runs, for results that can be checked
+for freshness more cheaply than they can be collected (e.g. the package
+list of a package manager, checked by its database's modification time).
+"""
+import json
+import os
+
+# Bumped when the layout of cached values changes, invalidating old files
+CACHE_VERSION = 1
+
+
+def cache_dir():
+    """Return the per-user cache directory of the scanner."""
+    if os.name == 'nt':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, 'system-scanner')
+
+
+def load(name, stamp):
+    """
+    Return the value stored under name if it was stored with the same
+    stamp, e.g. the modification times of the files it was read from.
+    
+    Args:
+        name: Cache entry name (used as the file name)
+        stamp: List of JSON-serializable values identifying the source data
+    
+    Returns:
+        The cached value, or None if missing, stale or unreadable
+    """
+    try:
+        with open(os.path.join(cache_dir(), name + '.json'), 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get('version') != CACHE_VERSION or entry.get('stamp') != list(stamp):
+        return None
+    return entry.get('value')
+
+
+def store(name, stamp, value):
+    """
+    Store a JSON-serializable value under name with its stamp. Failures
+    (e.g. a read-only home directory) are ignored; the cache is optional.
+    """
+    directory = cache_dir()
+    path = os.path.join(directory, name + '.json')
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'stamp': list(stamp), 'value': value}, f)
+        # Readers never see a partly written file
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -3,219 +3,1193 @@ Hardware Scanner Module
 Scans and collects hardware device information.
 Similar to Device Manager on Windows, this module scans all available hardware.
 """
+import csv
+import json
+import os
 import platform
 import subprocess
 import re
+import select
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from ._process import iter_lines
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+# Octal escapes used for whitespace in /proc/self/mountinfo fields (e.g. \040)
+_MOUNT_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape_mount_field(field):
+    """Decode the octal escapes the kernel uses in /proc/self/mountinfo."""
+    if '\\' not in field:
+        return field
+    return _MOUNT_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _read_file(path, binary=False):
+    """
+    Read a whole /proc or /sys file with os.open() and os.read(), without
+    the buffered file object; most of these files fit in the first read.
+    Raises OSError like open().
+    """
+    chunks = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    data = b''.join(chunks)
+    return data if binary else data.decode('utf-8', 'replace')
+
+
+# 'cpu MHz' lines of /proc/cpuinfo, one per logical CPU
+_CPU_MHZ_RE = re.compile(r'^cpu MHz\s*:\s*([0-9.]+)', re.MULTILINE)
+
+
+def _meminfo_kb(data, key):
+    """
+    Return the kB value of one /proc/meminfo field (e.g. b'MemTotal'),
+    or None if it is missing. data must start with a newline so that
+    every field, including the first, is matched at a line start.
+    """
+    key = b'\n' + key + b':'
+    start = data.find(key)
+    if start < 0:
+        return None
+    start += len(key)
+    end = data.find(b'\n', start)
+    try:
+        return int(data[start:end if end >= 0 else None].split()[0])
+    except (IndexError, ValueError):
+        return None
+
+
+# /proc/asound/cards and lsusb line formats
+_ASOUND_RE = re.compile(r'\d+\s+\[[^\]]+\]:\s+(.+)')
+_LSUSB_RE = re.compile(r'Bus\s+(\d+)\s+Device\s+(\d+):\s+ID\s+([0-9a-fA-F:]+)\s+(.+)')
+
+
+def _split_lspci_id(value):
+    """Split an `lspci -vmm -nn` field ('Intel Corporation [8086]') into its name and id."""
+    name, separator, ident = value.rpartition(' [')
+    if not separator or not ident.endswith(']'):
+        return value, ''
+    return name, ident[:-1]
+
+# "Handle 0x0002, DMI type 2, 15 bytes" header of a dmidecode block
+_DMI_HANDLE_RE = re.compile(r'DMI type (\d+),')
+
+class _IdsTable:
+    """
+    Names from a pci.ids or usb.ids file. The top-level entries (vendors,
+    classes) are indexed once when the file is loaded; the entries under
+    one of them (devices, subclasses) are parsed into a dictionary the
+    first time that entry is looked up.
+    """
+    
+    def __init__(self, text):
+        self._lines = lines = text.split('\n')
+        # Top-level id -> (name, line index); the first listing wins
+        self._parents = {}
+        for index, line in enumerate(lines):
+            if line and line[0] not in '\t#':
+                parent, sep, name = line.partition('  ')
+                if sep and parent not in self._parents:
+                    self._parents[parent] = (name.strip(), index)
+        # Top-level id -> {child id: name}, filled in on first lookup
+        self._children = {}
+    
+    def lookup(self, parent, child=None):
+        """
+        Look up names.
+        
+        Args:
+            parent: Top-level id, e.g. '8086' (vendor) or 'C 06' (class)
+            child: Id of a tab-indented entry under parent (device, subclass)
+        
+        Returns:
+            (parent name, child name) tuple; a name is None if not listed
+        """
+        entry = self._parents.get(parent)
+        if entry is None:
+            return None, None
+        parent_name, index = entry
+        if child is None:
+            return parent_name, None
+        
+        children = self._children.get(parent)
+        if children is None:
+            children = {}
+            lines = self._lines
+            index += 1
+            # The block ends at the next line that is not tab-indented;
+            # doubly indented lines (subsystems, prog-ifs) are skipped
+            while index < len(lines) and lines[index][:1] == '\t':
+                line = lines[index]
+                if line[1:2] != '\t':
+                    child_id, sep, name = line[1:].partition('  ')
+                    if sep and child_id not in children:
+                        children[child_id] = name.strip()
+                index += 1
+            self._children[parent] = children
+        return parent_name, children.get(child)
+
+
+# "Key: value" line of system_profiler output; like the split(':')[1] it
+# replaces, the value ends at the next colon
+_PROFILER_KV_RE = re.compile(r'\s*([^:]+?)\s*:\s*([^:]*)')
+
+
+def _profiler_field(line, fields):
+    """
+    Match a system_profiler "Key: value" line against fields, a dict of
+    key -> field name. A trailing parenthetical is ignored when comparing
+    keys, so 'VRAM (Total)' matches 'VRAM'.
+    
+    Returns:
+        (field name, value) tuple, or None if the line has no wanted key
+    """
+    match = _PROFILER_KV_RE.match(line)
+    if match is None:
+        return None
+    field = fields.get(match.group(1).partition(' (')[0])
+    if field is None:
+        return None
+    return field, match.group(2).strip()
+
+
+# str() of every known address family, computed once instead of per address.
+# AddressFamily members hash like their int values, so either can be looked up.
+_AF_NAMES = {family: str(family) for family in socket.AddressFamily}
+
+
+def _platform_info():
+    """
+    Read the platform details used by the scanner. They never change while
+    the process runs, but platform.processor() may spawn `uname -p`.
+    The architecture is the interpreter's pointer width, which is what
+    platform.architecture()[0] reports without running `file` on it.
+    A failing lookup is reported as an empty string so the module still loads.
+    """
+    info = {}
+    for key, lookup in (
+        ('system', platform.system),
+        ('processor', platform.processor),
+        ('machine', platform.machine),
+        ('architecture', lambda: f"{struct.calcsize('P') * 8}bit"),
+    ):
+        try:
+            info[key] = lookup()
+        except Exception:
+            info[key] = ''
+    return info
+
+
+_PLATFORM = _platform_info()
+
+
+# Cache of scan results shared by all HardwareScanner instances:
+# key -> (monotonic timestamp, value)
+_CACHE = {}
+
+
+def _cached(key, ttl, fn):
+    """
+    Return the cached result of fn() stored under key, calling fn()
+    again only when the cached value is older than ttl seconds.
+    """
+    now = time.monotonic()
+    entry = _CACHE.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    
+    value = fn()
+    _CACHE[key] = (now, value)
+    return value
+
+
+# External commands that timed out or failed in the probe _probe_complete()
+# is running on the current thread (commands is None outside of one)
+_PROBE_FAILURES = threading.local()
+
+
+class _LazyDict(dict):
+    """
+    Dictionary whose values are computed on first access.
+    
+    Each pending key maps to a probe function that is run the first time
+    the key is read; a probe that raises stays pending and is retried on
+    the next read. len() and truth tests count pending keys without
+    running them. Iterating, comparing or printing computes every pending
+    key first. The json module and dict.copy() read the dictionary's
+    storage directly, so convert with materialize() or copy() (which
+    returns a plain dict) before serializing.
+    """
+    
+    def __init__(self, probes):
+        super().__init__()
+        self._order = [key for key, _ in probes]
+        self._probes = dict(probes)
+        # Held while a probe runs, so concurrent readers run it only once
+        self._lock = threading.RLock()
+    
+    def __missing__(self, key):
+        with self._lock:
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)  # Computed by another reader
+            if key not in self._probes:
+                raise KeyError(key)
+            value = self._probes[key]()
+            del self._probes[key]
+            dict.__setitem__(self, key, value)
+            return value
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._probes.pop(key, None)
+            dict.__setitem__(self, key, value)
+    
+    def __contains__(self, key):
+        return key in self._probes or dict.__contains__(self, key)
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def materialize(self):
+        """Compute every pending key and restore the original key order."""
+        with self._lock:
+            if self._probes:
+                for key in list(self._probes):
+                    self[key]
+                values = dict(dict.items(self))
+                ordered = [key for key in self._order if key in values]
+                ordered += [key for key in values if key not in ordered]
+                dict.clear(self)
+                dict.update(self, ((key, values[key]) for key in ordered))
+        return self
+    
+    def copy(self):
+        """Return a plain dictionary of every key, computing pending ones."""
+        return dict(dict.items(self.materialize()))
+    
+    def __iter__(self):
+        return dict.__iter__(self.materialize())
+    
+    def __len__(self):
+        return dict.__len__(self) + len(self._probes)
+    
+    def __eq__(self, other):
+        return dict.__eq__(self.materialize(), other)
+    
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
+    
+    def keys(self):
+        return dict.keys(self.materialize())
+    
+    def values(self):
+        return dict.values(self.materialize())
+    
+    def items(self):
+        return dict.items(self.materialize())
+
+
+def _flatten(prefix, value):
+    """
+    Yield (dotted key, value) pairs for a nested scan result; list items
+    are keyed by their index (e.g. 'disks.0.mountpoint').
+    """
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(f'{prefix}.{key}', item)
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _flatten(f'{prefix}.{index}', item)
+    else:
+        yield prefix, value
+
+
+class _MountWatcher:
+    """
+    Detects mount table changes without re-reading it.
+    
+    The kernel flags an open /proc/self/mountinfo with POLLPRI after any
+    mount or unmount since the last poll, so a zero-timeout poll() tells
+    whether the cached partition list is still valid.
+    """
+    
+    def __init__(self):
+        self._file = open('/proc/self/mountinfo', 'rb')
+        self._poller = select.poll()
+        self._poller.register(self._file.fileno(), select.POLLPRI)
+    
+    def changed(self):
+        """Return True if the mount table changed since the last call."""
+        return bool(self._poller.poll(0))
 
 
 class HardwareScanner:
     """Scanner for hardware device information."""
     
-    # DMI keys to extract from dmidecode output
-    DMI_KEYS = ['manufacturer', 'product_name', 'version', 'vendor', 'serial_number']
+    # dmidecode keys to extract, mapped to field names
+    DMI_FIELDS = {
+        'Manufacturer': 'manufacturer',
+        'Product Name': 'product_name',
+        'Version': 'version',
+        'Vendor': 'vendor',
+        'Serial Number': 'serial_number',
+    }
     
-    def __init__(self):
+    # Cache lifetimes (seconds) for data that rarely or never changes
+    STATIC_TTL = float('inf')      # CPU model, core counts, architecture
+    CPU_FREQ_TTL = 1.0             # Current CPU frequency
+    MEMORY_TTL = 1.0               # /proc/meminfo figures
+    PARTITIONS_TTL = 60.0          # Disk partition list where mounts cannot be watched
+    NET_IF_TTL = 5.0               # Network interface addresses
+    PCI_TTL = 300.0                # PCI device list
+    SCAN_TTL = 60.0                # Whole result returned by get_info()
+    
+    # Seconds to wait for the concurrently run sections in scan()
+    SECTION_TIMEOUT = 10.0
+    
+    # Hardware sections, each run by its own worker in scan()
+    SECTION_WORKERS = 9
+    
+    # Sections that shell out to lspci, lsusb, wmic, dmidecode, etc. Every
+    # subprocess call has its own timeout, so these are always waited for
+    SUBPROCESS_SECTIONS = frozenset(['gpu', 'audio', 'usb', 'pci', 'system_devices'])
+    
+    # Seconds before each external command is abandoned, per timeout_profile.
+    # 'fast' keeps one hung command from stalling the whole scan; the
+    # sections whose commands timed out are listed in timed_out_sections so
+    # rescan_timed_out() can rerun them with 'thorough', whose timeouts are
+    # the long ones used previously
+    TIMEOUT_PROFILES = {
+        'fast': {
+            'lspci': 3, 'lsusb': 3, 'dmidecode': 2, 'system_profiler': 10,
+            'wmic': 8, 'powershell': 15,
+        },
+        'thorough': {
+            'lspci': 30, 'lsusb': 30, 'dmidecode': 10, 'system_profiler': 30,
+            'wmic': 60, 'powershell': 60,
+        },
+    }
+    
+    # Seconds to wait for the per-mount usage reads in _get_disk_info();
+    # mounts still blocked after that (e.g. hung NFS) get an error entry
+    DISK_USAGE_TIMEOUT = 2.0
+    
+    # Sections reported as lists (a timed-out list section becomes [error])
+    LIST_SECTIONS = frozenset(['disks', 'network'])
+    
+    # Virtual and read-only image filesystems left out of the disk list
+    # unless include_pseudo is set (their usage is meaningless or constant)
+    PSEUDO_FS = frozenset([
+        'proc', 'sysfs', 'devpts', 'cgroup', 'cgroup2', 'overlay', 'squashfs',
+        'tmpfs', 'devtmpfs', 'autofs', 'mqueue', 'debugfs', 'tracefs',
+        'securityfs', 'pstore', 'bpf', 'configfs', 'fusectl', 'rpc_pipefs',
+        'hugetlbfs',
+    ])
+    
+    # Device name prefixes likewise left out (loop-mounted images, e.g. snaps)
+    PSEUDO_DEVICES = ('/dev/loop',)
+    
+    # system_profiler keys collected per macOS device, mapped to field names
+    PROFILER_GPU_FIELDS = {'Chipset Model': 'name', 'VRAM': 'vram'}
+    PROFILER_USB_FIELDS = {
+        'Vendor ID': 'vendor_id',
+        'Product ID': 'product_id',
+        'Manufacturer': 'manufacturer',
+    }
+    PROFILER_PCI_FIELDS = {'Vendor ID': 'vendor_id', 'Device ID': 'device_id'}
+    PROFILER_HARDWARE_FIELDS = {
+        'Model Name': 'name',
+        'Model Identifier': 'model_id',
+        'Serial Number': 'serial',
+    }
+    
+    # Windows device queries: key -> (WMI class, filter, properties).
+    # All of them are answered by one PowerShell CIM call where possible,
+    # otherwise by one wmic call each
+    WINDOWS_QUERIES = {
+        'gpu': ('Win32_VideoController', None, ['Name', 'AdapterRAM', 'DriverVersion']),
+        'audio': ('Win32_SoundDevice', None, ['Name', 'Status']),
+        'usb_hub': ('Win32_USBHub', None, ['Name', 'DeviceID', 'Status']),
+        'usb_controller': ('Win32_USBController', None, ['Name', 'DeviceID', 'Status']),
+        'pci': ('Win32_PnPEntity', "DeviceID like 'PCI%'", ['Name', 'DeviceID', 'Status']),
+        'bios': ('Win32_BIOS', None, ['Manufacturer', 'Name', 'Version']),
+        'baseboard': ('Win32_BaseBoard', None, ['Manufacturer', 'Product', 'Version']),
+        'computersystem': ('Win32_ComputerSystem', None, ['Manufacturer', 'Model']),
+    }
+    WINDOWS_CIM_TTL = 5.0          # Shared by the sections of one scan
+    
+    # PCI class codes of audio controllers
+    PCI_AUDIO_CLASSES = frozenset(['0401', '0403'])
+    
+    # Device name databases used by lspci and lsusb
+    PCI_IDS_PATHS = ['/usr/share/hwdata/pci.ids', '/usr/share/misc/pci.ids', '/usr/share/pci.ids']
+    USB_IDS_PATHS = ['/usr/share/hwdata/usb.ids', '/usr/share/misc/usb.ids', '/var/lib/usbutils/usb.ids']
+    
+    # Serializes the bulk CIM query between concurrently running sections
+    _cim_lock = threading.Lock()
+    
+    # Worker pool shared by all instances, created on first scan
+    _executor = None
+    
+    # Worker pool for per-mount usage reads, created on first use; separate
+    # from _executor because _get_disk_info itself runs on that pool
+    _disk_executor = None
+    
+    # Usage reads of the disk pool by (device, mountpoint, fstype), for
+    # those not known to have finished; guarded by _disk_lock
+    _pending_usage = {}
+    _disk_lock = threading.Lock()
+    
+    # Mount table watcher shared by all instances (False if unavailable)
+    _mount_watcher = None
+    
+    def __init__(self, include_pseudo=False, compact_network=False, network_addresses=True,
+                 timeout_profile='fast'):
+        if timeout_profile not in self.TIMEOUT_PROFILES:
+            raise ValueError(f"Unknown timeout profile: {timeout_profile}")
         self.hardware_info = {}
+        self.include_pseudo = include_pseudo
+        self.compact_network = compact_network
+        self.network_addresses = network_addresses
+        self.timeout_profile = timeout_profile
+        # External commands that timed out during the last scan, and the
+        # sections that ran them
+        self.timed_out = set()
+        self.timed_out_sections = set()
+        self._scan_ts = 0.0
+        # PCI device list shared by the GPU, audio and PCI sections of one
+        # scan: None until read, then a (devices, failed commands) tuple
+        self._pci = None
+        self._pci_lock = threading.Lock()
     
-    def scan(self):
-        """Scan all hardware device information."""
-        self.hardware_info = {
-            'cpu': self._get_cpu_info(),
-            'memory': self._get_memory_info(),
-            'disks': self._get_disk_info(),
-            'network': self._get_network_info(),
-            'gpu': self._get_gpu_info(),
-            'audio': self._get_audio_info(),
-            'usb': self._get_usb_info(),
-            'pci': self._get_pci_info(),
-            'system_devices': self._get_system_devices(),
-        }
+    @classmethod
+    def _get_executor(cls):
+        """Return the shared worker pool, creating it on first use."""
+        if cls._executor is None:
+            # One worker per section so every probe of a scan runs at once
+            cls._executor = ThreadPoolExecutor(max_workers=cls.SECTION_WORKERS, thread_name_prefix='hwscan')
+        return cls._executor
+    
+    @classmethod
+    def _get_disk_executor(cls):
+        """Return the shared disk usage worker pool, creating it on first use."""
+        if cls._disk_executor is None:
+            cls._disk_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='hwscan-disk')
+        return cls._disk_executor
+    
+    @classmethod
+    def _get_mount_watcher(cls):
+        """Return the shared mount watcher, or None where mounts cannot be polled."""
+        if cls._mount_watcher is None:
+            cls._mount_watcher = False
+            if _PLATFORM['system'] == 'Linux' and hasattr(select, 'poll'):
+                try:
+                    cls._mount_watcher = _MountWatcher()
+                except OSError:
+                    pass
+        return cls._mount_watcher or None
+    
+    def _run_sections(self, sections, executor=None):
+        """
+        Run section probes concurrently on the shared worker pool.
+        
+        Args:
+            sections: Sequence of (key, probe function) pairs
+            executor: Worker pool to use instead of the shared one; it
+                needs a free worker for every section
+        
+        Returns:
+            Dictionary mapping each key to its probe result, or to an
+            error entry if the probe did not finish within SECTION_TIMEOUT
+            (SUBPROCESS_SECTIONS are waited for until they finish). Keys
+            whose commands timed out are added to timed_out_sections.
+        """
+        executor = executor or self._get_executor()
+        futures = [(key, executor.submit(self._probe_complete, fn)) for key, fn in sections]
+        done, _ = wait([future for _, future in futures], timeout=self.SECTION_TIMEOUT)
+        
+        results = {}
+        for key, future in futures:
+            if future in done or key in self.SUBPROCESS_SECTIONS:
+                results[key], failed = future.result()
+                if self.timed_out.intersection(failed):
+                    self.timed_out_sections.add(key)
+            else:
+                error = {'error': 'timeout'}
+                results[key] = [error] if key in self.LIST_SECTIONS else error
+        return results
+    
+    def scan(self, lazy=False, executor=None):
+        """
+        Scan all hardware device information.
+        
+        Args:
+            lazy: Return a dictionary whose sections are each computed the
+                first time they are read instead of all of them now, so
+                callers that only need e.g. memory skip the disk and device
+                probes. It is a dict subclass; call its materialize() or
+                copy() before passing it to json or copying it.
+            executor: Worker pool for the section probes, e.g. one shared
+                with other scanners (default: the scanner's own)
+        
+        Returns:
+            Dictionary of hardware information sections
+        """
+        sections = self._sections()
+        self._scan_ts = time.monotonic()
+        self.timed_out = set()
+        self.timed_out_sections = set()
+        self._pci = None
+        if lazy:
+            self.hardware_info = _LazyDict(sections)
+            return self.hardware_info
+        
+        # The sections mostly wait on /proc, /sys, statvfs and external
+        # commands, so their latencies overlap instead of adding up
+        self.hardware_info = self._run_sections(sections, executor)
         return self.hardware_info
     
+    def rescan_timed_out(self, executor=None, timeout_profile='thorough'):
+        """
+        Rerun the sections of the last scan() whose external commands timed
+        out, with the longer timeouts of another profile.
+        
+        Args:
+            executor: Worker pool for the section probes, as for scan()
+            timeout_profile: TIMEOUT_PROFILES entry to rerun them with
+        
+        Returns:
+            Dictionary of hardware information sections, updated in place;
+            sections that timed out again are left in timed_out_sections
+        """
+        retry = [(key, probe) for key, probe in self._sections() if key in self.timed_out_sections]
+        if not retry:
+            return self.hardware_info
+        
+        previous = self.timeout_profile
+        self.timeout_profile = timeout_profile
+        self.timed_out = set()
+        self.timed_out_sections = set()
+        self._pci = None
+        try:
+            self.hardware_info.update(self._run_sections(retry, executor))
+        finally:
+            self.timeout_profile = previous
+        return self.hardware_info
+    
+    def scan_stream(self):
+        """
+        Scan hardware one section at a time, for callers that process or
+        send each section as it arrives instead of holding the whole result.
+        
+        Yields:
+            (section name, section value) tuples, in scan() key order
+        """
+        self._pci = None
+        for key, probe in self._sections():
+            yield key, probe()
+    
+    def _sections(self):
+        """Return the (key, probe function) pairs for every hardware section."""
+        return [
+            ('cpu', self._get_cpu_info),
+            ('memory', self._get_memory_info),
+            ('disks', self._get_disk_info),
+            ('network', self._get_network_info),
+            ('gpu', self._get_gpu_info),
+            ('audio', self._get_audio_info),
+            ('usb', self._get_usb_info),
+            # PCI and DMI devices do not change while running (short of
+            # hotplug), so their subprocess calls are not repeated every scan
+            ('pci', lambda: self._get_cached_devices('pci', self.PCI_TTL, self._get_pci_info)),
+            ('system_devices', lambda: self._get_cached_devices(
+                'system_devices', self.STATIC_TTL, self._get_system_devices)),
+        ]
+    
+    def _get_cached_devices(self, key, ttl, probe):
+        """Return copies of a device list cached for ttl seconds."""
+        devices, failed = _cached(key, ttl, lambda: self._probe_complete(probe))
+        if failed:
+            # Possibly incomplete because one of its commands timed out or
+            # failed; probe again next time instead of keeping it for the whole ttl
+            _CACHE.pop(key, None)
+            for name in failed:
+                self._record_failure(name)  # For the section running this
+        return [dict(device) for device in devices]
+    
+    def _probe_complete(self, probe):
+        """
+        Run probe() and list the external commands it ran that timed out
+        or failed. These are collected per thread, so those of sections
+        running at the same time are not attributed to this probe.
+        
+        Returns:
+            (probe result, list of the commands that timed out or failed)
+            tuple
+        """
+        previous = getattr(_PROBE_FAILURES, 'commands', None)
+        _PROBE_FAILURES.commands = commands = []
+        try:
+            result = probe()
+        finally:
+            _PROBE_FAILURES.commands = previous
+        return result, commands
+    
+    def _record_timeout(self, name):
+        """Record a timed-out command in timed_out and for _probe_complete()."""
+        self.timed_out.add(name)
+        self._record_failure(name)
+    
+    def _record_failure(self, name):
+        """Record a timed-out or failed command for _probe_complete()."""
+        commands = getattr(_PROBE_FAILURES, 'commands', None)
+        if commands is not None:
+            commands.append(name)
+    
+    def _run(self, cmd, timeout=None, probe=None):
+        """
+        Run an external command and capture its output as text.
+        
+        Args:
+            cmd: Command and arguments
+            timeout: Seconds before giving up; defaults to the command's
+                entry in TIMEOUT_PROFILES[timeout_profile]
+            probe: Name recorded in timed_out (defaults to the command line)
+        
+        Returns:
+            subprocess.CompletedProcess
+        
+        Raises:
+            FileNotFoundError: The command is not installed
+            subprocess.TimeoutExpired: The command ran longer than timeout
+        """
+        if timeout is None:
+            timeout = self.TIMEOUT_PROFILES[self.timeout_profile][cmd[0]]
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._record_timeout(probe or ' '.join(cmd))
+            raise
+    
+    def _run_lines(self, cmd, timeout=None, probe=None):
+        """
+        Run an external command and yield its output lines as they are
+        written (see _process.iter_lines()), for the line-oriented parsers.
+        
+        Arguments are as for _run().
+        
+        Raises:
+            FileNotFoundError: The command is not installed
+            subprocess.TimeoutExpired: The command was killed after timeout
+                seconds (the lines read until then have been yielded)
+            subprocess.CalledProcessError: The command exited with a
+                non-zero status after its last line; callers drop what
+                they parsed, as its output may be partial or empty
+        """
+        if timeout is None:
+            timeout = self.TIMEOUT_PROFILES[self.timeout_profile][cmd[0]]
+        try:
+            yield from iter_lines(cmd, timeout, check=True)
+        except subprocess.TimeoutExpired:
+            self._record_timeout(probe or ' '.join(cmd))
+            raise
+        except subprocess.CalledProcessError:
+            self._record_failure(probe or ' '.join(cmd))
+            raise
+    
+    def flat(self):
+        """
+        Yield the hardware information as flat (dotted key, value) pairs,
+        e.g. ('cpu.model', ...) or ('disks.0.free_bytes', ...), for metric
+        exporters that take scalar samples. Scans first if needed.
+        """
+        if not self.hardware_info:
+            self.scan()
+        for section, value in self.hardware_info.items():
+            yield from _flatten(section, value)
+    
     def _get_cpu_info(self):
         """Get CPU information."""
+        cpu_info = dict(_cached('cpu', self.STATIC_TTL, self._get_cpu_static_info))
+        
+        frequency = _cached('cpu_freq', self.CPU_FREQ_TTL, self._get_cpu_frequency)
+        if frequency is not None:
+            cpu_info['frequency_mhz'] = frequency
+        
+        model = _cached('cpu_model', self.STATIC_TTL, self._get_cpu_model)
+        if model:
+            cpu_info['model'] = model
+        
+        return cpu_info
+    
+    def _get_cpu_static_info(self):
+        """Get CPU information that does not change while running."""
         cpu_info = {
-            'processor': platform.processor(),
-            'machine': platform.machine(),
-            'architecture': platform.architecture()[0],
+            'processor': _PLATFORM['processor'],
+            'machine': _PLATFORM['machine'],
+            'architecture': _PLATFORM['architecture'],
         }
         
         # Try to get more details using psutil
-        try:
-            import psutil
+        if PSUTIL_AVAILABLE:
             cpu_info['physical_cores'] = psutil.cpu_count(logical=False)
             cpu_info['logical_cores'] = psutil.cpu_count(logical=True)
-            cpu_info['frequency_mhz'] = psutil.cpu_freq().current if psutil.cpu_freq() else 'N/A'
-        except ImportError:
-            pass
         
-        # Try to get CPU model on Linux
-        if platform.system() == 'Linux':
+        return cpu_info
+    
+    def _get_cpu_frequency(self):
+        """Get the current CPU frequency in MHz (None if it cannot be read)."""
+        if _PLATFORM['system'] == 'Linux':
+            # psutil reads scaling_cur_freq for every CPU, which takes
+            # 10+ ms per CPU on some machines; one /proc/cpuinfo read has
+            # every CPU's frequency, and CPU0's cpufreq file stands in
+            # where cpuinfo has none (e.g. ARM)
+            frequency = self._get_cpuinfo_frequency()
+            if frequency is None:
+                frequency = self._get_cpu0_frequency()
+            if frequency is not None:
+                return frequency
+        
+        if not PSUTIL_AVAILABLE:
+            return None
+        
+        freq = psutil.cpu_freq()
+        return freq.current if freq else 'N/A'
+    
+    def _get_cpu0_frequency(self):
+        """Get CPU0's current frequency in MHz from cpufreq, or None."""
+        try:
+            khz = _read_file('/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq', binary=True)
+            return int(khz) / 1000.0
+        except (OSError, ValueError):
+            return None
+    
+    def _get_cpuinfo_frequency(self):
+        """Get the mean 'cpu MHz' value from /proc/cpuinfo, or None."""
+        try:
+            data = _read_file('/proc/cpuinfo')
+        except (FileNotFoundError, IOError):
+            return None
+        
+        values = []
+        for value in _CPU_MHZ_RE.findall(data):
+            try:
+                values.append(float(value))
+            except ValueError:
+                pass
+        
+        return sum(values) / len(values) if values else None
+    
+    def _get_cpu_model(self):
+        """Get the CPU model name (Linux only)."""
+        if _PLATFORM['system'] == 'Linux':
             try:
-                with open('/proc/cpuinfo', 'r') as f:
-                    for line in f:
-                        if 'model name' in line:
-                            cpu_info['model'] = line.split(':')[1].strip()
-                            break
+                # One read and a C-level search instead of iterating lines;
+                # /proc/cpuinfo repeats a block for every logical CPU
+                data = _read_file('/proc/cpuinfo')
+                idx = data.find('model name')
+                if idx >= 0:
+                    end = data.find('\n', idx)
+                    return data[idx:end if end >= 0 else None].partition(':')[2].strip()
             except (FileNotFoundError, IOError):
                 pass
         
-        return cpu_info
+        return None
     
     def _get_memory_info(self):
         """Get memory information."""
-        memory_info = {}
+        if _PLATFORM['system'] == 'Linux':
+            # Repeated scans within MEMORY_TTL reuse one read
+            memory_info = _cached('meminfo', self.MEMORY_TTL, self._get_proc_meminfo)
+            if memory_info:
+                return dict(memory_info)
+        
+        if not PSUTIL_AVAILABLE:
+            return {'error': 'psutil not installed'}
         
+        mem = psutil.virtual_memory()
+        return {
+            'total_bytes': mem.total,
+            'available_bytes': mem.available,
+            'used_bytes': mem.used,
+            'percent_used': (mem.total - mem.available) * 100 // mem.total,
+        }
+    
+    def _get_proc_meminfo(self):
+        """
+        Get memory information from a single read of /proc/meminfo.
+        Values are computed the same way as psutil.virtual_memory().
+        
+        Returns:
+            Memory information dictionary, or None if /proc/meminfo is
+            unavailable or lacks MemAvailable (pre-3.14 kernels)
+        """
         try:
-            import psutil
-            mem = psutil.virtual_memory()
-            memory_info['total_gb'] = round(mem.total / (1024**3), 2)
-            memory_info['available_gb'] = round(mem.available / (1024**3), 2)
-            memory_info['used_gb'] = round(mem.used / (1024**3), 2)
-            memory_info['percent_used'] = mem.percent
-        except ImportError:
-            memory_info['error'] = 'psutil not installed'
+            data = _read_file('/proc/meminfo', binary=True)
+        except (FileNotFoundError, IOError):
+            return None
+        
+        # Only three of the ~50 fields are needed; find them directly
+        # instead of splitting every line
+        data = b'\n' + data
+        total = _meminfo_kb(data, b'MemTotal')
+        available = _meminfo_kb(data, b'MemAvailable')
+        if not total or not available:
+            return None
+        if available > total:
+            available = _meminfo_kb(data, b'MemFree') or 0
+        total *= 1024  # kB -> bytes
+        available *= 1024
+        used = total - available
         
-        return memory_info
+        return {
+            'total_bytes': total,
+            'available_bytes': available,
+            'used_bytes': used,
+            'percent_used': used * 100 // total,
+        }
     
     def _get_disk_info(self):
         """Get disk information."""
-        disks = []
+        # Device, mountpoint and fstype rarely change and are cached; only
+        # the usage figures are read on every call. Where mount changes can
+        # be watched the list is kept until one happens, otherwise it expires.
+        ttl = self.PARTITIONS_TTL
+        watcher = self._get_mount_watcher()
+        if watcher is not None:
+            ttl = self.STATIC_TTL
+            if watcher.changed():
+                _CACHE.pop('disk_partitions', None)
+                _CACHE.pop('disk_partitions_all', None)
         
-        try:
-            import psutil
-            partitions = psutil.disk_partitions()
+        key = 'disk_partitions_all' if self.include_pseudo else 'disk_partitions'
+        partitions = _cached(key, ttl, self._get_partitions)
+        if partitions is None:
+            return [{'error': 'psutil not installed'}]
+        
+        # statvfs releases the GIL but can block for seconds on a slow NFS or
+        # FUSE mount; read all mounts in parallel so the slowest one bounds
+        # the total instead of each adding to it. A read still running from
+        # an earlier or concurrent scan is waited for instead of started
+        # again: each one holds a worker until the mount answers, so
+        # resubmitting would use up the pool.
+        executor = self._get_disk_executor()
+        futures = []
+        with self._disk_lock:
+            pending = self._pending_usage
+            for key in [key for key, future in pending.items() if future.done()]:
+                del pending[key]
             for partition in partitions:
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk = {
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total_gb': round(usage.total / (1024**3), 2),
-                        'used_gb': round(usage.used / (1024**3), 2),
-                        'free_gb': round(usage.free / (1024**3), 2),
-                        'percent_used': usage.percent,
-                    }
-                    disks.append(disk)
-                except (PermissionError, OSError):
-                    disks.append({
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'error': 'Permission denied or unavailable',
-                    })
-        except ImportError:
-            disks.append({'error': 'psutil not installed'})
+                key = (partition['device'], partition['mountpoint'], partition['fstype'])
+                future = pending.get(key)
+                if future is None:
+                    future = executor.submit(self._get_partition_usage, partition)
+                    pending[key] = future
+                futures.append(future)
         
-        return disks
+        wait(set(futures), timeout=self.DISK_USAGE_TIMEOUT)
+        # Results are copied, as a read may be shared with another scan
+        return [
+            dict(future.result()) if future.done() else dict(partition, error='timeout')
+            for partition, future in zip(partitions, futures)
+        ]
     
-    def _get_network_info(self):
-        """Get network interface information."""
-        network_info = []
+    def _get_partitions(self):
+        """
+        List the mounted partitions. Unless include_pseudo is set, only
+        device-backed filesystems are listed and PSEUDO_FS types are skipped
+        without reading their usage.
+        
+        Returns:
+            List of {'device', 'mountpoint', 'fstype'} dictionaries, or None
+            if they cannot be listed (psutil missing and no /proc)
+        """
+        partitions = None
+        if _PLATFORM['system'] == 'Linux':
+            partitions = self._get_proc_mounts(self.include_pseudo)
+        if partitions is None:
+            if not PSUTIL_AVAILABLE:
+                return None
+            partitions = [
+                (p.device, p.mountpoint, p.fstype)
+                for p in psutil.disk_partitions(all=self.include_pseudo)
+            ]
+        
+        if not self.include_pseudo:
+            partitions = [
+                (device, mountpoint, fstype)
+                for device, mountpoint, fstype in partitions
+                if fstype not in self.PSEUDO_FS and not device.startswith(self.PSEUDO_DEVICES)
+            ]
+        return [
+            {'device': device, 'mountpoint': mountpoint, 'fstype': fstype}
+            for device, mountpoint, fstype in partitions
+        ]
+    
+    def _get_proc_mounts(self, all_fs=False):
+        """
+        List mounted physical filesystems from one read of /proc/self/mountinfo.
+        Filtering matches psutil.disk_partitions(): only filesystem types
+        that /proc/filesystems lists as device-backed (plus zfs) are kept.
+        Unless all_fs is set, bind mounts of an already listed filesystem
+        are skipped as well; they are recognized by the device number and
+        root mountinfo lists, so no mountpoint is touched (a stat() would
+        block on a hung network mount).
         
+        Args:
+            all_fs: Keep every mount, like disk_partitions(all=True)
+        
+        Returns:
+            List of (device, mountpoint, fstype) tuples, or None if /proc
+            is unavailable
+        """
         try:
-            import psutil
-            interfaces = psutil.net_if_addrs()
-            for interface_name, addresses in interfaces.items():
-                interface = {
-                    'name': interface_name,
-                    'addresses': []
-                }
-                for addr in addresses:
-                    interface['addresses'].append({
-                        'family': str(addr.family),
+            # Each file is read in one call: iterating a procfs file
+            # regenerates its contents for every buffered chunk
+            filesystems = _read_file('/proc/filesystems').splitlines()
+            mounts = _read_file('/proc/self/mountinfo').splitlines()
+        except (FileNotFoundError, IOError):
+            return None
+        
+        fstypes = set()
+        for line in filesystems:
+            nodev, _, fstype = line.rpartition('\t')
+            if not nodev or fstype == 'zfs':
+                fstypes.add(fstype)
+        
+        partitions = []
+        seen_mounts = set()
+        for line in mounts:
+            # "<id> <parent> <major:minor> <root> <mountpoint> <options>
+            # [<optional fields>...] - <fstype> <source> <super options>"
+            fields = line.split()
+            try:
+                separator = fields.index('-', 6)
+                fstype, device = fields[separator + 1:separator + 3]
+            except ValueError:
+                continue
+            fstype = _unescape_mount_field(fstype)
+            device = _unescape_mount_field(device)
+            mountpoint = _unescape_mount_field(fields[4])
+            if device == 'none':
+                device = ''
+            if not all_fs and (not device or fstype not in fstypes):
+                continue
+            # A mount repeating both the device number and the root within
+            # the filesystem is a bind mount of one already listed. The
+            # device number alone is not enough: btrfs subvolumes and bind
+            # mounts of other subtrees share it. st_dev would tell those
+            # apart too, but needs a stat() of every mountpoint
+            if not all_fs:
+                key = (fields[2], fields[3])
+                if key in seen_mounts:
+                    continue
+                seen_mounts.add(key)
+            partitions.append((device, mountpoint, fstype))
+        
+        return partitions
+    
+    def _get_partition_usage(self, partition):
+        """
+        Get a partition entry with its current usage.
+        Uses os.statvfs() where available, computing the values the same
+        way as psutil.disk_usage(), and psutil elsewhere.
+        
+        Args:
+            partition: Cached partition dictionary from _get_partitions();
+                it is copied, not modified
+        
+        Returns:
+            New dictionary with the partition fields and usage (or an error)
+        """
+        try:
+            if hasattr(os, 'statvfs'):
+                st = os.statvfs(partition['mountpoint'])
+                total = st.f_blocks * st.f_frsize
+                free = st.f_bavail * st.f_frsize
+                used = total - st.f_bfree * st.f_frsize
+            else:
+                total, used, free, _ = psutil.disk_usage(partition['mountpoint'])
+        except (PermissionError, OSError):
+            return dict(partition, error='Permission denied or unavailable')
+        
+        # Percentage of the space available to unprivileged users
+        total_user = used + free
+        return dict(
+            partition,
+            total_bytes=total,
+            used_bytes=used,
+            free_bytes=free,
+            percent_used=used * 100 // total_user if total_user else 0,
+        )
+    
+    def _get_network_info(self):
+        """
+        Get network interface information.
+        
+        With compact_network set, each interface is a {'name', 'mac',
+        'ipv4', 'ipv6'} dict instead of a dict with a list of addresses. Without
+        network_addresses (or psutil), only names and MAC addresses are
+        read from /sys/class/net and psutil is not called.
+        """
+        if not (PSUTIL_AVAILABLE and self.network_addresses):
+            if _PLATFORM['system'] == 'Linux':
+                interfaces = _cached('sys_class_net', self.NET_IF_TTL, self._get_sys_class_net)
+                if interfaces is not None:
+                    if self.compact_network:
+                        return [
+                            {'name': name, 'mac': mac, 'ipv4': None, 'ipv6': None}
+                            for name, mac in interfaces
+                        ]
+                    link_family = _AF_NAMES[socket.AF_PACKET]
+                    return [
+                        {
+                            'name': name,
+                            'addresses': [{'family': link_family, 'address': mac, 'netmask': None}],
+                        }
+                        for name, mac in interfaces
+                    ]
+            if not PSUTIL_AVAILABLE:
+                return [{'error': 'psutil not installed'}]
+        
+        interfaces = _cached('net_if_addrs', self.NET_IF_TTL, psutil.net_if_addrs)
+        if self.compact_network:
+            return self._get_compact_network_info(interfaces)
+        
+        network_info = []
+        af_names = _AF_NAMES
+        for interface_name, addresses in interfaces.items():
+            network_info.append({
+                'name': interface_name,
+                'addresses': [
+                    {
+                        'family': af_names.get(addr.family) or str(addr.family),
                         'address': addr.address,
                         'netmask': addr.netmask,
-                    })
-                network_info.append(interface)
-        except ImportError:
-            network_info.append({'error': 'psutil not installed'})
+                    }
+                    for addr in addresses
+                ],
+            })
         
         return network_info
     
+    def _get_compact_network_info(self, interfaces):
+        """Reduce psutil.net_if_addrs() output to one name/MAC/IPv4/IPv6 dict per interface."""
+        af_link, af_inet, af_inet6 = psutil.AF_LINK, socket.AF_INET, socket.AF_INET6
+        network_info = []
+        for interface_name, addresses in interfaces.items():
+            mac = ipv4 = ipv6 = None
+            for addr in addresses:
+                family = addr.family
+                if family == af_inet:
+                    ipv4 = ipv4 or addr.address
+                elif family == af_inet6:
+                    ipv6 = ipv6 or addr.address
+                elif family == af_link:
+                    mac = mac or addr.address
+            network_info.append({'name': interface_name, 'mac': mac, 'ipv4': ipv4, 'ipv6': ipv6})
+        return network_info
+    
+    def _get_sys_class_net(self):
+        """
+        List network interfaces and their MAC addresses from /sys/class/net,
+        used when psutil is not installed.
+        
+        Returns:
+            List of (name, mac) tuples in interface index order, or None if
+            /sys/class/net is unavailable
+        """
+        try:
+            entries = list(os.scandir('/sys/class/net'))
+        except OSError:
+            return None
+        
+        interfaces = []
+        for entry in entries:
+            try:
+                ifindex = int(_read_file(entry.path + '/ifindex'))
+                mac = _read_file(entry.path + '/address').strip()
+            except (OSError, ValueError):
+                continue
+            interfaces.append((ifindex, entry.name, mac))
+        
+        interfaces.sort()
+        return [(name, mac) for _, name, mac in interfaces]
+    
     def _get_gpu_info(self):
         """Get GPU/display adapter information."""
         gpu_info = []
-        system = platform.system()
+        system = _PLATFORM['system']
         
         if system == 'Linux':
-            # Try lspci for GPU info
-            try:
-                result = subprocess.run(
-                    ['lspci', '-v'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    current_device = None
-                    for line in result.stdout.split('\n'):
-                        if line and not line.startswith('\t') and not line.startswith(' '):
-                            # Check for VGA/3D/Display controller
-                            if 'VGA' in line or '3D' in line or 'Display' in line:
-                                parts = line.split(': ', 1)
-                                if len(parts) > 1:
-                                    current_device = {
-                                        'name': parts[1].strip(),
-                                        'type': 'GPU',
-                                    }
-                                    gpu_info.append(current_device)
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+            # Display controllers (VGA, 3D, other), named as lspci prints them
+            for device in self._pci_devices() or []:
+                if device['class_code'].startswith('03'):
+                    gpu_info.append({
+                        'name': device['plain_name'],
+                        'type': 'GPU',
+                    })
             
             # Also check /proc/driver/nvidia if available (for NVIDIA GPUs)
             try:
-                with open('/proc/driver/nvidia/version', 'r') as f:
-                    version = f.read().strip()
-                    driver_version = version.split('\n')[0] if version else 'Unknown'
-                    for gpu in gpu_info:
-                        if 'NVIDIA' in gpu.get('name', '').upper():
-                            gpu['driver_version'] = driver_version
+                version = _read_file('/proc/driver/nvidia/version').strip()
+                driver_version = version.split('\n')[0] if version else 'Unknown'
+                for gpu in gpu_info:
+                    if 'NVIDIA' in gpu.get('name', '').upper():
+                        gpu['driver_version'] = driver_version
             except (FileNotFoundError, IOError):
                 pass
                 
         elif system == 'Windows':
             try:
                 # Use WMIC to get GPU info
-                # CSV format: Node,AdapterRAM,DriverVersion,Name
-                result = subprocess.run(
-                    ['wmic', 'path', 'win32_VideoController', 'get', 
-                     'Name,AdapterRAM,DriverVersion', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        # Expected format: Node,AdapterRAM,DriverVersion,Name (4 parts)
-                        if len(parts) >= 4 and parts[3]:
-                            gpu_info.append({
-                                'name': parts[3],
-                                'memory_bytes': parts[1] if parts[1] else 'Unknown',
-                                'driver_version': parts[2] if parts[2] else 'Unknown',
-                                'type': 'GPU',
-                            })
+                for row in self._query_windows('gpu'):
+                    if row.get('Name'):
+                        gpu_info.append({
+                            'name': row['Name'],
+                            'memory_bytes': row.get('AdapterRAM') or 'Unknown',
+                            'driver_version': row.get('DriverVersion') or 'Unknown',
+                            'type': 'GPU',
+                        })
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
                 
         elif system == 'Darwin':  # macOS
             try:
-                result = subprocess.run(
-                    ['system_profiler', 'SPDisplaysDataType'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    current_gpu = {}
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if line.endswith(':') and not line.startswith('Displays') and not line.startswith('Graphics'):
-                            if current_gpu and current_gpu.get('name'):
-                                gpu_info.append(current_gpu)
-                            current_gpu = {'name': line.rstrip(':'), 'type': 'GPU'}
-                        elif 'Chipset Model:' in line:
-                            current_gpu['name'] = line.split(':')[1].strip()
-                        elif 'VRAM' in line:
-                            current_gpu['vram'] = line.split(':')[1].strip()
-                    if current_gpu and current_gpu.get('name'):
-                        gpu_info.append(current_gpu)
+                current_gpu = {}
+                for line in self._run_lines(['system_profiler', 'SPDisplaysDataType']):
+                    line = line.strip()
+                    if line.endswith(':') and not line.startswith(('Displays', 'Graphics')):
+                        if current_gpu and current_gpu.get('name'):
+                            gpu_info.append(current_gpu)
+                        current_gpu = {'name': line.rstrip(':'), 'type': 'GPU'}
+                    else:
+                        field = _profiler_field(line, self.PROFILER_GPU_FIELDS)
+                        if field:
+                            current_gpu[field[0]] = field[1]
+                if current_gpu and current_gpu.get('name'):
+                    gpu_info.append(current_gpu)
+            except subprocess.CalledProcessError:
+                gpu_info = []  # Drop the output of a failed run
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
         
@@ -224,103 +1198,147 @@ class HardwareScanner:
     def _get_audio_info(self):
         """Get audio device information."""
         audio_info = []
-        system = platform.system()
+        system = _PLATFORM['system']
         
         if system == 'Linux':
-            # Try lspci for audio controllers
-            try:
-                result = subprocess.run(
-                    ['lspci'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'Audio' in line or 'audio' in line:
-                            parts = line.split(': ', 1)
-                            if len(parts) > 1:
-                                audio_info.append({
-                                    'name': parts[1].strip(),
-                                    'type': 'Audio Controller',
-                                })
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+            # Audio controllers (multimedia audio and HD audio devices)
+            for device in self._pci_devices() or []:
+                if device['class_code'] in self.PCI_AUDIO_CLASSES:
+                    audio_info.append({
+                        'name': device['plain_name'],
+                        'type': 'Audio Controller',
+                    })
             
             # Also check ALSA sound cards
             try:
-                with open('/proc/asound/cards', 'r') as f:
-                    content = f.read()
-                    # Parse card info
-                    for line in content.split('\n'):
-                        if line.strip() and line[0].isdigit():
-                            # Format: " 0 [PCH            ]: HDA-Intel - HDA Intel PCH"
-                            match = re.search(r'\d+\s+\[[^\]]+\]:\s+(.+)', line)
-                            if match:
-                                card_name = match.group(1).strip()
-                                # Avoid duplicates
-                                if not any(card_name in a.get('name', '') for a in audio_info):
-                                    audio_info.append({
-                                        'name': card_name,
-                                        'type': 'Sound Card',
-                                    })
+                content = _read_file('/proc/asound/cards')
+                # Parse card info
+                for line in content.split('\n'):
+                    if line.strip() and line[0].isdigit():
+                        # Format: " 0 [PCH            ]: HDA-Intel - HDA Intel PCH"
+                        match = _ASOUND_RE.search(line)
+                        if match:
+                            card_name = match.group(1).strip()
+                            # Avoid duplicates
+                            if not any(card_name in a.get('name', '') for a in audio_info):
+                                audio_info.append({
+                                    'name': card_name,
+                                    'type': 'Sound Card',
+                                })
             except (FileNotFoundError, IOError):
                 pass
                 
         elif system == 'Windows':
             try:
-                # CSV format: Node,Name,Status
-                result = subprocess.run(
-                    ['wmic', 'sounddev', 'get', 'Name,Status', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        # Expected format: Node,Name,Status (3 parts)
-                        if len(parts) >= 3 and parts[1]:
-                            audio_info.append({
-                                'name': parts[1],
-                                'status': parts[2] if parts[2] else 'Unknown',
-                                'type': 'Audio Device',
-                            })
+                for row in self._query_windows('audio'):
+                    if row.get('Name'):
+                        audio_info.append({
+                            'name': row['Name'],
+                            'status': row.get('Status') or 'Unknown',
+                            'type': 'Audio Device',
+                        })
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
                 
         elif system == 'Darwin':
             try:
-                result = subprocess.run(
-                    ['system_profiler', 'SPAudioDataType'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('Audio:') and line.endswith(':'):
-                            audio_info.append({
-                                'name': line.rstrip(':'),
-                                'type': 'Audio Device',
-                            })
+                for line in self._run_lines(['system_profiler', 'SPAudioDataType']):
+                    line = line.strip()
+                    if line and not line.startswith('Audio:') and line.endswith(':'):
+                        audio_info.append({
+                            'name': line.rstrip(':'),
+                            'type': 'Audio Device',
+                        })
+            except subprocess.CalledProcessError:
+                audio_info = []  # Drop the output of a failed run
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
         
         return audio_info if audio_info else []
     
+    def _get_ids(self, paths):
+        """Return an _IdsTable of the first readable ids file in paths, or None."""
+        for path in paths:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    return _IdsTable(f.read())
+            except OSError:
+                pass
+        return None
+    
+    def _read_sys_string(self, path):
+        """Return the stripped contents of a sysfs attribute, or None if missing or empty."""
+        try:
+            return _read_file(path).strip() or None
+        except OSError:
+            return None
+    
+    def _get_sys_usb_devices(self):
+        """
+        List USB devices from /sys/bus/usb/devices, named from usb.ids like
+        lsusb does, without running lsusb.
+        
+        Returns:
+            List of USB device dictionaries sorted by bus and device number,
+            or None if sysfs or usb.ids is unavailable
+        """
+        ids = _cached('usb_ids', self.STATIC_TTL, lambda: self._get_ids(self.USB_IDS_PATHS))
+        if ids is None:
+            return None
+        try:
+            entries = list(os.scandir('/sys/bus/usb/devices'))
+        except OSError:
+            return None
+        
+        devices = []
+        for entry in entries:
+            path = entry.path + '/'
+            try:
+                vendor_id = _read_file(path + 'idVendor').strip()
+            except OSError:
+                continue  # An interface, not a device
+            try:
+                product_id = _read_file(path + 'idProduct').strip()
+                bus = int(_read_file(path + 'busnum'))
+                device = int(_read_file(path + 'devnum'))
+            except (OSError, ValueError):
+                continue
+            
+            # Like lsusb, fall back to the device's own strings for names
+            # missing from usb.ids
+            vendor_name, product_name = ids.lookup(vendor_id, product_id)
+            if vendor_name is None:
+                vendor_name = self._read_sys_string(path + 'manufacturer')
+            if product_name is None:
+                product_name = self._read_sys_string(path + 'product')
+            name = ' '.join(part for part in (vendor_name, product_name) if part)
+            if name:
+                devices.append((bus, device, {
+                    'bus': f'{bus:03d}',
+                    'device': f'{device:03d}',
+                    'id': f'{vendor_id}:{product_id}',
+                    'name': name,
+                    'type': 'USB Device',
+                }))
+        
+        devices.sort(key=lambda item: item[:2])
+        return [info for _, _, info in devices]
+    
     def _get_usb_info(self):
         """Get USB device information."""
         usb_info = []
-        system = platform.system()
+        system = _PLATFORM['system']
         
         if system == 'Linux':
-            # Try lsusb
-            try:
-                result = subprocess.run(
-                    ['lsusb'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
+            # lsusb reads the same sysfs files and usb.ids; do that directly
+            usb_info = self._get_sys_usb_devices()
+            if usb_info is None:
+                usb_info = []
+                try:
+                    for line in self._run_lines(['lsusb']):
                         if line:
                             # Format: Bus 001 Device 001: ID 1d6b:0002 Linux Foundation 2.0 root hub
-                            match = re.match(r'Bus\s+(\d+)\s+Device\s+(\d+):\s+ID\s+([0-9a-fA-F:]+)\s+(.+)', line)
+                            match = _LSUSB_RE.match(line)
                             if match:
                                 usb_info.append({
                                     'bus': match.group(1),
@@ -329,150 +1347,373 @@ class HardwareScanner:
                                     'name': match.group(4),
                                     'type': 'USB Device',
                                 })
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+                except subprocess.CalledProcessError:
+                    usb_info = []  # Drop the output of a failed run
+                except (FileNotFoundError, subprocess.TimeoutExpired):
+                    pass
                 
         elif system == 'Windows':
             try:
-                # CSV format: Node,DeviceID,Name,Status
-                result = subprocess.run(
-                    ['wmic', 'path', 'Win32_USBHub', 'get', 'Name,DeviceID,Status', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        # Expected format: Node,DeviceID,Name,Status (4 parts)
-                        if len(parts) >= 4 and parts[1]:
-                            usb_info.append({
-                                'name': parts[2] if parts[2] else parts[1],
-                                'device_id': parts[1],
-                                'status': parts[3] if parts[3] else 'Unknown',
-                                'type': 'USB Hub',
-                            })
-                
-                # Also get USB controllers
-                result = subprocess.run(
-                    ['wmic', 'path', 'Win32_USBController', 'get', 'Name,DeviceID,Status', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        # Expected format: Node,DeviceID,Name,Status (4 parts)
-                        if len(parts) >= 4 and parts[1]:
+                # USB hubs, then USB controllers
+                for query, device_type in (('usb_hub', 'USB Hub'), ('usb_controller', 'USB Controller')):
+                    for row in self._query_windows(query):
+                        if row.get('DeviceID'):
                             usb_info.append({
-                                'name': parts[2] if parts[2] else parts[1],
-                                'device_id': parts[1],
-                                'status': parts[3] if parts[3] else 'Unknown',
-                                'type': 'USB Controller',
+                                'name': row.get('Name') or row['DeviceID'],
+                                'device_id': row['DeviceID'],
+                                'status': row.get('Status') or 'Unknown',
+                                'type': device_type,
                             })
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
                 
         elif system == 'Darwin':
             try:
-                result = subprocess.run(
-                    ['system_profiler', 'SPUSBDataType'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    current_device = None
-                    for line in result.stdout.split('\n'):
-                        stripped = line.strip()
-                        if stripped and stripped.endswith(':') and not stripped.startswith('USB'):
-                            if current_device:
-                                usb_info.append(current_device)
-                            current_device = {'name': stripped.rstrip(':'), 'type': 'USB Device'}
-                        elif current_device and 'Vendor ID:' in stripped:
-                            current_device['vendor_id'] = stripped.split(':')[1].strip()
-                        elif current_device and 'Product ID:' in stripped:
-                            current_device['product_id'] = stripped.split(':')[1].strip()
-                    if current_device:
-                        usb_info.append(current_device)
+                current_device = None
+                for line in self._run_lines(['system_profiler', 'SPUSBDataType']):
+                    stripped = line.strip()
+                    if stripped and stripped.endswith(':') and not stripped.startswith('USB'):
+                        if current_device:
+                            usb_info.append(current_device)
+                        current_device = {'name': stripped.rstrip(':'), 'type': 'USB Device'}
+                    elif current_device:
+                        field = _profiler_field(stripped, self.PROFILER_USB_FIELDS)
+                        if field:
+                            current_device[field[0]] = field[1]
+                if current_device:
+                    usb_info.append(current_device)
+            except subprocess.CalledProcessError:
+                usb_info = []  # Drop the output of a failed run
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
         
         return usb_info if usb_info else []
     
+    def _pci_devices(self):
+        """
+        Return the PCI device list shared by the GPU, audio and PCI
+        sections, read once per scan from sysfs and pci.ids, or from lspci
+        where those are unavailable. It is not kept past the scan, so the
+        next one reads it again.
+        
+        Returns:
+            List of PCI device dictionaries as described for
+            _get_sys_pci_devices(), or None if lspci failed
+        """
+        with self._pci_lock:
+            if self._pci is None:
+                devices = self._get_sys_pci_devices()
+                if devices is not None:
+                    self._pci = (devices, [])
+                else:
+                    self._pci = self._probe_complete(self._get_lspci_devices)
+            devices, failed = self._pci
+        # Reported to every section using the result, so none of them is
+        # cached (see _get_cached_devices()) and all of them are rerun by
+        # rescan_timed_out() if lspci timed out
+        for name in failed:
+            self._record_failure(name)
+        return devices
+    
+    def _get_lspci_devices(self):
+        """
+        List PCI devices with one `lspci -vmm -nn` run, whose fields give
+        each name both on its own and with the numeric ids.
+        
+        Returns:
+            List of PCI device dictionaries as described for
+            _get_sys_pci_devices(), or None if lspci failed
+        """
+        records = []
+        fields = {}
+        try:
+            # "Field:\tvalue" lines, with a blank line after each device
+            for line in self._run_lines(['lspci', '-vmm', '-nn']):
+                field, separator, value = line.partition(':\t')
+                if separator:
+                    fields[field] = value
+                elif fields:
+                    records.append(fields)
+                    fields = {}
+            if fields:
+                records.append(fields)
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return None
+        
+        devices = []
+        for fields in records:
+            if 'Slot' not in fields:
+                continue
+            device_class = fields.get('Class', '')
+            class_name, class_code = _split_lspci_id(device_class)
+            vendor_name, vendor_id = _split_lspci_id(fields.get('Vendor', ''))
+            device_name, device_id = _split_lspci_id(fields.get('Device', ''))
+            revision = f" (rev {fields['Rev']})" if fields.get('Rev') else ''
+            devices.append({
+                'slot': fields['Slot'],
+                'class_code': class_code,
+                'device_class': device_class,
+                'name': f'{vendor_name} {device_name} [{vendor_id}:{device_id}]{revision}',
+                'class_name': class_name,
+                'plain_name': f'{vendor_name} {device_name}{revision}',
+            })
+        return devices
+    
+    def _get_sys_pci_devices(self):
+        """
+        List PCI devices from /sys/bus/pci/devices, named from pci.ids like
+        lspci does, without running lspci.
+        
+        Returns:
+            List of dictionaries in slot order, with the slot, device_class
+            and name as printed by `lspci -nn`, the class_name and
+            plain_name as printed by plain `lspci` and the four-digit
+            class_code, or None if sysfs or pci.ids is unavailable
+        """
+        ids = _cached('pci_ids', self.STATIC_TTL, lambda: self._get_ids(self.PCI_IDS_PATHS))
+        if ids is None:
+            return None
+        try:
+            slots = sorted(entry.name for entry in os.scandir('/sys/bus/pci/devices'))
+        except OSError:
+            return None
+        
+        # lspci leaves out the domain unless some device is outside domain 0
+        show_domain = any(not slot.startswith('0000:') for slot in slots)
+        
+        devices = []
+        for slot in slots:
+            path = f'/sys/bus/pci/devices/{slot}/'
+            try:
+                vendor_id = _read_file(path + 'vendor').strip()[2:]
+                device_id = _read_file(path + 'device').strip()[2:]
+                class_code = _read_file(path + 'class').strip()[2:6]
+                revision = int(_read_file(path + 'revision'), 16)
+            except (OSError, ValueError):
+                continue
+            
+            class_name, subclass_name = ids.lookup('C ' + class_code[:2], class_code[2:])
+            class_name = subclass_name or class_name
+            
+            # Plain lspci prints the ids in place of names missing from pci.ids
+            vendor_name, device_name = ids.lookup(vendor_id, device_id)
+            if vendor_name and device_name:
+                name = plain_name = f'{vendor_name} {device_name}'
+            elif vendor_name:
+                name, plain_name = f'{vendor_name} Device', f'{vendor_name} Device {device_id}'
+            else:
+                name, plain_name = 'Device', f'Device {vendor_id}:{device_id}'
+            rev = f' (rev {revision:02x})' if revision else ''
+            
+            devices.append({
+                'slot': slot if show_domain else slot[5:],
+                'class_code': class_code,
+                'device_class': f'{class_name or "Class"} [{class_code}]',
+                'name': f'{name} [{vendor_id}:{device_id}]{rev}',
+                'class_name': class_name or f'Class {class_code}',
+                'plain_name': plain_name + rev,
+            })
+        
+        return devices
+    
     def _get_pci_info(self):
         """Get PCI device information."""
         pci_info = []
-        system = platform.system()
+        system = _PLATFORM['system']
         
         if system == 'Linux':
-            try:
-                result = subprocess.run(
-                    ['lspci', '-nn'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
-                        if line:
-                            # Format: 00:00.0 Host bridge [0600]: Intel Corporation...
-                            match = re.match(r'([0-9a-fA-F:.]+)\s+([^:]+):\s+(.+)', line)
-                            if match:
-                                pci_info.append({
-                                    'slot': match.group(1),
-                                    'device_class': match.group(2).strip(),
-                                    'name': match.group(3).strip(),
-                                    'type': 'PCI Device',
-                                })
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
+            pci_info = [
+                {
+                    'slot': device['slot'],
+                    'device_class': device['device_class'],
+                    'name': device['name'],
+                    'type': 'PCI Device',
+                }
+                for device in self._pci_devices() or []
+            ]
                 
         elif system == 'Windows':
             try:
                 # Use wmic to get PCI devices via PnP entities
-                # CSV format: Node,DeviceID,Name,Status
-                result = subprocess.run(
-                    ['wmic', 'path', 'Win32_PnPEntity', 'where', 
-                     "DeviceID like 'PCI%'", 'get', 'Name,DeviceID,Status', '/format:csv'],
-                    capture_output=True, text=True, timeout=60
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        # Expected format: Node,DeviceID,Name,Status (4 parts)
-                        if len(parts) >= 4 and parts[1]:
-                            pci_info.append({
-                                'device_id': parts[1],
-                                'name': parts[2] if parts[2] else 'Unknown',
-                                'status': parts[3] if parts[3] else 'Unknown',
-                                'type': 'PCI Device',
-                            })
+                for row in self._query_windows('pci'):
+                    if row.get('DeviceID'):
+                        pci_info.append({
+                            'device_id': row['DeviceID'],
+                            'name': row.get('Name') or 'Unknown',
+                            'status': row.get('Status') or 'Unknown',
+                            'type': 'PCI Device',
+                        })
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
                 
         elif system == 'Darwin':
             try:
-                result = subprocess.run(
-                    ['system_profiler', 'SPPCIDataType'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    current_device = None
-                    for line in result.stdout.split('\n'):
-                        stripped = line.strip()
-                        if stripped and stripped.endswith(':') and not stripped.startswith('PCI'):
-                            if current_device:
-                                pci_info.append(current_device)
-                            current_device = {'name': stripped.rstrip(':'), 'type': 'PCI Device'}
-                        elif current_device and 'Vendor ID:' in stripped:
-                            current_device['vendor_id'] = stripped.split(':')[1].strip()
-                        elif current_device and 'Device ID:' in stripped:
-                            current_device['device_id'] = stripped.split(':')[1].strip()
-                    if current_device:
-                        pci_info.append(current_device)
+                current_device = None
+                for line in self._run_lines(['system_profiler', 'SPPCIDataType']):
+                    stripped = line.strip()
+                    if stripped and stripped.endswith(':') and not stripped.startswith('PCI'):
+                        if current_device:
+                            pci_info.append(current_device)
+                        current_device = {'name': stripped.rstrip(':'), 'type': 'PCI Device'}
+                    elif current_device:
+                        field = _profiler_field(stripped, self.PROFILER_PCI_FIELDS)
+                        if field:
+                            current_device[field[0]] = field[1]
+                if current_device:
+                    pci_info.append(current_device)
+            except subprocess.CalledProcessError:
+                pci_info = []  # Drop the output of a failed run
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
         
         return pci_info if pci_info else []
     
+    def _query_windows(self, query):
+        """
+        Get the rows of one WINDOWS_QUERIES entry, from the shared CIM
+        result if PowerShell is available and from wmic otherwise.
+        
+        Returns:
+            List of row dictionaries keyed by property name
+        """
+        with self._cim_lock:
+            cim = _cached('windows_cim', self.WINDOWS_CIM_TTL, self._run_cim_bulk)
+        if cim is not None:
+            return cim.get(query, [])
+        
+        wmi_class, where, properties = self.WINDOWS_QUERIES[query]
+        args = ['path', wmi_class]
+        if where:
+            args += ['where', where]
+        return self._run_wmic(args + ['get', ','.join(properties)])
+    
+    def _run_cim_bulk(self):
+        """
+        Answer every WINDOWS_QUERIES entry with a single PowerShell process
+        (one WMI session) instead of one wmic process per query.
+        
+        Returns:
+            Dictionary of query key -> list of row dictionaries, with values
+            as strings like wmic prints them, or None if PowerShell failed
+        """
+        commands = []
+        for query, (wmi_class, where, properties) in self.WINDOWS_QUERIES.items():
+            command = f"Get-CimInstance {wmi_class} -ErrorAction SilentlyContinue"
+            if where:
+                # Single-quoted so no double quotes reach the command line
+                escaped = where.replace("'", "''")
+                command += f" -Filter '{escaped}'"
+            commands.append(f"'{query}' = @({command} | Select-Object {','.join(properties)})")
+        script = '@{ ' + '; '.join(commands) + ' } | ConvertTo-Json -Depth 3 -Compress'
+        
+        try:
+            result = self._run(
+                ['powershell', '-NoProfile', '-NonInteractive', '-Command', script],
+                probe='powershell Get-CimInstance'
+            )
+            if result.returncode != 0:
+                return None
+            data = json.loads(result.stdout)
+        except (FileNotFoundError, subprocess.TimeoutExpired, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+        
+        cim = {}
+        for query, rows in data.items():
+            if isinstance(rows, dict):  # A single object is not wrapped in a list
+                rows = [rows]
+            cim[query] = [
+                {key: '' if value is None else str(value) for key, value in row.items()}
+                for row in (rows or []) if isinstance(row, dict)
+            ]
+        return cim
+    
+    def _run_wmic(self, args):
+        """
+        Run a wmic query with /format:csv and parse its output.
+        Columns are looked up by the names in wmic's header row.
+        
+        Args:
+            args: wmic arguments before /format:csv
+        
+        Returns:
+            List of row dictionaries keyed by column name ([] if wmic failed)
+        
+        Raises:
+            FileNotFoundError, subprocess.TimeoutExpired: As raised by _run
+        """
+        result = self._run(['wmic'] + args + ['/format:csv'])
+        if result.returncode != 0:
+            return []
+        
+        # wmic pads its output with blank lines and \r\r\n line ends
+        lines = [line.strip() for line in result.stdout.splitlines()]
+        return list(csv.DictReader(line for line in lines if line))
+    
+    def _read_dmi_types(self, dmi_types):
+        """
+        Read DMI/SMBIOS types with a single dmidecode run.
+        
+        Args:
+            dmi_types: Dictionary of DMI type number (str) -> device type
+        
+        Returns:
+            List of device dictionaries in dmi_types order, one per type
+            that dmidecode found ([] if dmidecode failed)
+        """
+        args = ['dmidecode']
+        for dmi_type in dmi_types:
+            args += ['-t', dmi_type]
+        try:
+            result = self._run(args)
+        except (FileNotFoundError, subprocess.TimeoutExpired, PermissionError):
+            return []
+        if result.returncode != 0:
+            return []
+        
+        # Fields of every "Handle 0x..., DMI type N, ..." block, merged per
+        # type; a later block of the same type overrides earlier ones
+        fields = {dmi_type: {} for dmi_type in dmi_types}
+        current = None
+        for line in result.stdout.split('\n'):
+            if line.startswith('Handle 0x'):
+                type_field = _DMI_HANDLE_RE.search(line)
+                current = fields.get(type_field.group(1)) if type_field else None
+                continue
+            if current is None:
+                continue
+            # One dict lookup per line instead of normalizing every key
+            key, sep, value = line.partition(':')
+            field = self.DMI_FIELDS.get(key.strip()) if sep else None
+            if field:
+                value = value.strip()
+                if value:
+                    current[field] = value
+        
+        devices = []
+        for dmi_type, device_type in dmi_types.items():
+            if not fields[dmi_type]:
+                continue
+            info = {'type': device_type}
+            info.update(fields[dmi_type])
+            
+            # Create a name from available info
+            name_parts = []
+            if 'manufacturer' in info:
+                name_parts.append(info['manufacturer'])
+            elif 'vendor' in info:
+                name_parts.append(info['vendor'])
+            if 'product_name' in info:
+                name_parts.append(info['product_name'])
+            info['name'] = ' '.join(name_parts) if name_parts else device_type
+            devices.append(info)
+        return devices
+    
     def _get_system_devices(self):
         """Get other system devices (motherboard, BIOS, etc.)."""
         system_devices = []
-        system = platform.system()
+        system = _PLATFORM['system']
         
         if system == 'Linux':
             # Get DMI/SMBIOS info
@@ -483,35 +1724,8 @@ class HardwareScanner:
                 '3': 'Chassis',
             }
             
-            for dmi_type, device_type in dmi_types.items():
-                try:
-                    result = subprocess.run(
-                        ['dmidecode', '-t', dmi_type],
-                        capture_output=True, text=True, timeout=10
-                    )
-                    if result.returncode == 0:
-                        info = {'type': device_type}
-                        for line in result.stdout.split('\n'):
-                            line = line.strip()
-                            if ':' in line and not line.startswith('#'):
-                                key, value = line.split(':', 1)
-                                key = key.strip().lower().replace(' ', '_')
-                                value = value.strip()
-                                if value and key in self.DMI_KEYS:
-                                    info[key] = value
-                        if len(info) > 1:  # Has more than just 'type'
-                            # Create a name from available info
-                            name_parts = []
-                            if 'manufacturer' in info:
-                                name_parts.append(info['manufacturer'])
-                            elif 'vendor' in info:
-                                name_parts.append(info['vendor'])
-                            if 'product_name' in info:
-                                name_parts.append(info['product_name'])
-                            info['name'] = ' '.join(name_parts) if name_parts else device_type
-                            system_devices.append(info)
-                except (FileNotFoundError, subprocess.TimeoutExpired, PermissionError):
-                    pass
+            # One dmidecode run (and SMBIOS table read) for all types
+            system_devices.extend(self._read_dmi_types(dmi_types))
             
             # If dmidecode failed, try reading from /sys
             if not system_devices:
@@ -522,89 +1736,60 @@ class HardwareScanner:
                 }
                 for device_type, path in dmi_paths.items():
                     try:
-                        with open(path, 'r') as f:
-                            name = f.read().strip()
-                            if name:
-                                system_devices.append({
-                                    'name': name,
-                                    'type': device_type,
-                                })
+                        name = _read_file(path).strip()
+                        if name:
+                            system_devices.append({
+                                'name': name,
+                                'type': device_type,
+                            })
                     except (FileNotFoundError, IOError, PermissionError):
                         pass
                         
         elif system == 'Windows':
             try:
-                # Get BIOS info
-                result = subprocess.run(
-                    ['wmic', 'bios', 'get', 'Manufacturer,Name,Version', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        if len(parts) >= 3 and parts[1]:
-                            system_devices.append({
-                                'name': f"{parts[1]} {parts[2]}" if len(parts) > 2 else parts[1],
-                                'version': parts[3] if len(parts) > 3 else 'Unknown',
-                                'type': 'BIOS',
-                            })
-                
-                # Get motherboard info
-                result = subprocess.run(
-                    ['wmic', 'baseboard', 'get', 'Manufacturer,Product,Version', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        if len(parts) >= 3 and parts[1]:
-                            system_devices.append({
-                                'name': f"{parts[1]} {parts[2]}" if len(parts) > 2 else parts[1],
-                                'version': parts[3] if len(parts) > 3 else 'Unknown',
-                                'type': 'Motherboard',
-                            })
-                
-                # Get system info
-                result = subprocess.run(
-                    ['wmic', 'computersystem', 'get', 'Manufacturer,Model', '/format:csv'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n')[1:]:
-                        parts = line.strip().split(',')
-                        if len(parts) >= 3 and parts[1]:
-                            system_devices.append({
-                                'name': f"{parts[1]} {parts[2]}" if len(parts) > 2 else parts[1],
-                                'type': 'System',
-                            })
+                # BIOS, motherboard and system: (query, name columns, version column, type)
+                queries = [
+                    ('bios', ('Manufacturer', 'Name'), 'Version', 'BIOS'),
+                    ('baseboard', ('Manufacturer', 'Product'), 'Version', 'Motherboard'),
+                    ('computersystem', ('Manufacturer', 'Model'), None, 'System'),
+                ]
+                for query, name_columns, version_column, device_type in queries:
+                    for row in self._query_windows(query):
+                        if row.get('Manufacturer'):
+                            device = {'name': ' '.join(row.get(column) or '' for column in name_columns)}
+                            if version_column:
+                                version = row.get(version_column)
+                                device['version'] = 'Unknown' if version is None else version
+                            device['type'] = device_type
+                            system_devices.append(device)
             except (FileNotFoundError, subprocess.TimeoutExpired):
                 pass
                 
         elif system == 'Darwin':
             try:
-                result = subprocess.run(
-                    ['system_profiler', 'SPHardwareDataType'],
-                    capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    info = {'type': 'System'}
-                    for line in result.stdout.split('\n'):
-                        stripped = line.strip()
-                        if 'Model Name:' in stripped:
-                            info['name'] = stripped.split(':')[1].strip()
-                        elif 'Model Identifier:' in stripped:
-                            info['model_id'] = stripped.split(':')[1].strip()
-                        elif 'Serial Number' in stripped:
-                            info['serial'] = stripped.split(':')[1].strip()
-                    if 'name' in info:
-                        system_devices.append(info)
-            except (FileNotFoundError, subprocess.TimeoutExpired):
+                info = {'type': 'System'}
+                for line in self._run_lines(['system_profiler', 'SPHardwareDataType']):
+                    field = _profiler_field(line, self.PROFILER_HARDWARE_FIELDS)
+                    if field:
+                        info[field[0]] = field[1]
+                if 'name' in info:
+                    system_devices.append(info)
+            except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
                 pass
         
         return system_devices if system_devices else []
     
     def get_info(self):
-        """Return the collected hardware information."""
-        if not self.hardware_info:
+        """
+        Return the collected hardware information, scanning again if
+        nothing was collected yet or the last scan is older than SCAN_TTL.
+        """
+        if not self.hardware_info or time.monotonic() - self._scan_ts >= self.SCAN_TTL:
             self.scan()
         return self.hardware_info
+    
+    def invalidate(self):
+        """Drop the collected and cached hardware information so the next read rescans."""
+        self.hardware_info = {}
+        self._scan_ts = 0.0
+        _CACHE.clear()
@@ -5,17 +5,24 @@ Scans and collects operating system information.
 import platform
 import sys
 
+try:
+    import distro
+    DISTRO_AVAILABLE = True
+except ImportError:
+    DISTRO_AVAILABLE = False
+
 
 class OSScanner:
     """Scanner for operating system information."""
     
     def __init__(self):
         self.os_info = {}
+        self._system = platform.system()
     
     def scan(self):
         """Scan operating system information."""
         self.os_info = {
-            'system': platform.system(),
+            'system': self._system,
             'release': platform.release(),
             'version': platform.version(),
             'machine': platform.machine(),
@@ -26,13 +33,12 @@ class OSScanner:
         }
         
         # Get additional info for different OS
-        if platform.system() == 'Linux':
-            try:
-                import distro
+        if self._system == 'Linux':
+            if DISTRO_AVAILABLE:
                 self.os_info['distro_name'] = distro.name()
                 self.os_info['distro_version'] = distro.version()
                 self.os_info['distro_id'] = distro.id()
-            except ImportError:
+            else:
                 # Try to read from /etc/os-release
                 try:
                     with open('/etc/os-release', 'r') as f:
@@ -45,7 +51,7 @@ class OSScanner:
                                 self.os_info['distro_id'] = line.split('=')[1].strip().strip('"')
                 except FileNotFoundError:
                     pass
-        elif platform.system() == 'Windows':
+        elif self._system == 'Windows':
             self.os_info['win_edition'] = platform.win32_edition() if hasattr(platform, 'win32_edition') else 'Unknown'
             
         return self.os_info
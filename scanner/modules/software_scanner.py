@@ -2,208 +2,611 @@
 Software Scanner Module
 Scans and collects installed software information.
 """
+import os
 import platform
+import plistlib
 import subprocess
 import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from operator import itemgetter
+
+from . import cache
+from ._process import iter_lines
+
+# Package, Version and Status fields of a /var/lib/dpkg/status paragraph
+_DPKG_FIELD_RE = re.compile(rb'^(Package|Version|Status): (.*)$', re.MULTILINE)
+
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+# shutil.which() results by command; PATH is searched once per command
+_WHICH = {}
+
+
+def _which(command):
+    """Return the path of an installed command, or None."""
+    if command not in _WHICH:
+        _WHICH[command] = shutil.which(command)
+    return _WHICH[command]
+
+
+class _PackageCap:
+    """
+    Tells a probe when it has listed enough packages for a scan limited to
+    limit items, counting packages the way the deduplicated result will.
+    """
+    
+    def __init__(self, limit, dedup):
+        self.limit = limit
+        self.dedup = dedup
+        self.seen = set()
+    
+    def reached(self, software):
+        """Return True once software holds enough packages; call after each append."""
+        if not self.dedup:
+            return len(software) >= self.limit
+        item = software[-1]
+        self.seen.add((item['name'].lower(), item['version']))
+        return len(self.seen) >= self.limit
+
+
+def _software_entry(name, version, vendor, software_type):
+    """Build the dictionary describing one installed package."""
+    return {'name': name, 'version': version, 'vendor': vendor, 'type': software_type}
 
 
 class SoftwareScanner:
     """Scanner for installed software information."""
     
-    def __init__(self):
+    # Files whose modification times change whenever a package manager's
+    # package list does; while they are unchanged, the list is read from
+    # the on-disk cache instead of running the manager again
+    CACHE_STAMP_PATHS = {
+        'dpkg': ['/var/lib/dpkg/status'],
+        'rpm': ['/var/lib/rpm/rpmdb.sqlite', '/var/lib/rpm/Packages', '/usr/lib/sysimage/rpm/rpmdb.sqlite'],
+        'snap': ['/var/lib/snapd/state.json'],
+        # flatpak touches .changed in an installation on every change
+        'flatpak': ['/var/lib/flatpak/.changed', '~/.local/share/flatpak/.changed'],
+    }
+    
+    # Registry keys listed by _scan_windows, as (winreg hive name, path);
+    # their last-write times stamp its cache
+    UNINSTALL_KEYS = [
+        ('HKEY_LOCAL_MACHINE', 'Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall'),
+        ('HKEY_LOCAL_MACHINE', 'Software\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall'),
+        ('HKEY_CURRENT_USER', 'Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall'),
+    ]
+    
+    # PowerShell drives of the UNINSTALL_KEYS hives, and the software type
+    # of each row tag the PowerShell script emits
+    POWERSHELL_DRIVES = {'HKEY_LOCAL_MACHINE': 'HKLM', 'HKEY_CURRENT_USER': 'HKCU'}
+    POWERSHELL_SOURCE_TYPES = {'uninstall': 'windows'}
+    
+    # Most package manager probes one scan runs at once (dpkg, rpm, snap
+    # and flatpak on Linux)
+    PROBE_WORKERS = 4
+    
+    def __init__(self, use_cache=True, dedup=True):
         self.software_list = []
+        self.use_cache = use_cache
+        # Drop packages listed more than once with the same name and
+        # version (e.g. by dpkg and snap, or for several architectures)
+        self.dedup = dedup
+    
+    def scan(self, executor=None, limit=0):
+        """
+        Scan installed software based on the operating system.
+        
+        Args:
+            executor: Worker pool for the package manager probes, e.g. one
+                shared with other scanners (default: a pool of the scan's own)
+            limit: Maximum number of software items to list (0 = no limit);
+                the package managers stop once they have listed enough
+        """
+        self.software_list = list(self.iter_scan(executor, limit))
+        return self.software_list
+    
+    def iter_scan(self, executor=None, limit=0):
+        """
+        Yield installed software as each package manager's list becomes
+        available, so callers can process packages while the slower
+        managers are still running. The order matches scan().
+        
+        Args:
+            executor: Worker pool for the package manager probes; it needs
+                a free worker for each probe (up to PROBE_WORKERS)
+            limit: Maximum number of software items to yield (0 = no limit)
+        
+        Yields:
+            Software dictionaries
+        """
+        items = self._iter_system(executor, limit)
+        if self.dedup:
+            items = self._iter_unique(items)
+        if limit > 0:
+            items = islice(items, limit)
+        yield from items
+    
+    def _iter_unique(self, items):
+        """Yield items, skipping packages already yielded."""
+        # Keyed by case-insensitive name and version; the first listing wins
+        seen = set()
+        for software in items:
+            if 'error' not in software:
+                key = (software['name'].lower(), software['version'])
+                if key in seen:
+                    continue
+                seen.add(key)
+            yield software
     
-    def scan(self):
-        """Scan installed software based on the operating system."""
+    def _iter_system(self, executor, limit=0):
+        """
+        Yield installed software of the running operating system. With a
+        limit, each package manager lists at most as many packages as the
+        limited result can take from it.
+        """
         system = platform.system()
         
         if system == 'Linux':
-            self.software_list = self._scan_linux()
+            yield from self._iter_linux(executor, limit)
         elif system == 'Windows':
-            self.software_list = self._scan_windows()
+            yield from self._scan_windows(limit)
         elif system == 'Darwin':  # macOS
-            self.software_list = self._scan_macos()
+            yield from self._iter_macos(executor, limit)
         else:
-            self.software_list = [{'error': f'Unsupported OS: {system}'}]
+            yield {'error': f'Unsupported OS: {system}'}
+    
+    def _probe_executor(self, executor):
+        """
+        Return a context manager giving executor, or a pool of
+        PROBE_WORKERS that is shut down on exit if executor is None.
+        """
+        if executor is None:
+            return ThreadPoolExecutor(max_workers=self.PROBE_WORKERS)
+        return nullcontext(executor)
+    
+    def _iter_linux(self, executor=None, limit=0):
+        """Yield installed software on Linux systems."""
+        # The package managers are independent and each mostly waits on its
+        # command, so all of them run at once
+        with self._probe_executor(executor) as executor:
+            dpkg = executor.submit(self._cached_scan, 'dpkg', self._scan_dpkg, limit)
+            # rpm is only used without dpkg packages, but starting it
+            # straight away costs less than waiting for dpkg first
+            rpm = executor.submit(self._cached_scan, 'rpm', self._scan_rpm, limit)
+            snap = executor.submit(self._cached_scan, 'snap', self._scan_snap, limit)
+            flatpak = executor.submit(self._cached_scan, 'flatpak', self._scan_flatpak, limit)
+            
+            software = dpkg.result()
+            # Try rpm (Red Hat/CentOS/Fedora) if no dpkg packages found
+            if not software:
+                software = rpm.result()
+            yield from software
+            # Also add snap and flatpak packages
+            yield from snap.result()
+            yield from flatpak.result()
+    
+    def _cached_scan(self, name, probe, limit=0):
+        """
+        Return probe(limit)'s package list, or the cached one while the
+        package database it was read from is unchanged.
         
-        return self.software_list
+        Args:
+            name: Package manager key of CACHE_STAMP_PATHS, 'windows' or 'macos_apps'
+            probe: Function listing the packages
+            limit: Package limit passed to probe; a limited listing may be
+                incomplete, so it is not cached (a cached complete one is used)
+        """
+        stamp = self._cache_stamp(name) if self.use_cache else None
+        if stamp is None:
+            return probe(limit)
+        
+        software = cache.load('software-' + name, stamp)
+        if software is None:
+            software = probe(limit)
+            # Empty or failed listings are not kept; they may be a timeout
+            if software and not limit and not any('error' in item for item in software):
+                cache.store('software-' + name, stamp, software)
+        return software
     
-    def _scan_linux(self):
-        """Scan installed software on Linux systems."""
-        software = []
+    def _cache_stamp(self, name):
+        """
+        Return the modification times identifying a package manager's
+        current package list, or None if they cannot be determined.
+        """
+        if name == 'windows':
+            return self._uninstall_keys_stamp()
+        if name == 'macos_apps':
+            return self._applications_stamp()
         
-        # Try dpkg (Debian/Ubuntu)
-        try:
-            result = subprocess.run(
-                ['dpkg-query', '-W', '-f=${Package}\t${Version}\t${Status}\n'],
-                capture_output=True, text=True, timeout=60
-            )
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split('\t')
-                    if len(parts) < 2:
-                        continue
-                    # Check if package is installed (for dpkg, status is in the third column)
-                    is_installed = True
-                    if len(parts) > 2:
-                        is_installed = 'installed' in parts[-1]
-                    if is_installed:
-                        software.append({
-                            'name': parts[0],
-                            'version': parts[1] if len(parts) > 1 else 'Unknown',
-                            'vendor': 'Unknown',
-                            'type': 'dpkg',
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        stamp = []
+        for path in self.CACHE_STAMP_PATHS[name]:
+            try:
+                stamp.append(os.stat(os.path.expanduser(path)).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return stamp if any(mtime is not None for mtime in stamp) else None
+    
+    def _uninstall_keys_stamp(self):
+        """
+        Return the subkey count, last-write time and latest subkey
+        last-write time of each Uninstall registry key, or None. Installing
+        or removing a program updates the key itself; an in-place upgrade
+        only rewrites the program's own subkey, so every subkey is checked.
+        """
+        if not WINREG_AVAILABLE:
+            return None
         
-        # Try rpm (Red Hat/CentOS/Fedora) if no dpkg packages found
-        if not software:
+        stamp = []
+        enum_key, open_key, query_info = winreg.EnumKey, winreg.OpenKey, winreg.QueryInfoKey
+        for hive, path in self.UNINSTALL_KEYS:
             try:
-                result = subprocess.run(
-                    ['rpm', '-qa', '--queryformat', '%{NAME}\t%{VERSION}\t%{VENDOR}\n'],
-                    capture_output=True, text=True, timeout=60
-                )
-                if result.returncode == 0:
-                    for line in result.stdout.strip().split('\n'):
-                        if line:
-                            parts = line.split('\t')
-                            software.append({
-                                'name': parts[0],
-                                'version': parts[1] if len(parts) > 1 else 'Unknown',
-                                'vendor': parts[2] if len(parts) > 2 else 'Unknown',
-                                'type': 'rpm',
-                            })
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-        
-        # Also scan snap packages
+                with self._open_uninstall_key(hive, path) as key:
+                    subkeys, _, modified = query_info(key)
+                    latest = modified
+                    for index in range(subkeys):
+                        try:
+                            with open_key(key, enum_key(key, index)) as subkey:
+                                latest = max(latest, query_info(subkey)[2])
+                        except OSError:
+                            pass
+            except OSError:
+                stamp.append(None)
+                continue
+            stamp.append([subkeys, modified, latest])
+        return stamp if any(entry is not None for entry in stamp) else None
+    
+    def _scan_dpkg(self, limit=0):
+        """List installed dpkg (Debian/Ubuntu) packages, at most limit if set."""
+        software = self._read_dpkg_status(limit=limit)
+        if software is not None:
+            return software
+        
+        software = []
+        if not _which('dpkg-query'):
+            return software
+        cap = _PackageCap(limit, self.dedup)
         try:
-            result = subprocess.run(
-                ['snap', 'list'],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        software.append({
-                            'name': parts[0],
-                            'version': parts[1],
-                            'vendor': 'Snap Store',
-                            'type': 'snap',
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+            append = software.append
+            for line in iter_lines(['dpkg-query', '-W', '-f=${Package}\t${Version}\t${Status}\n'], 60, check=True):
+                parts = line.split('\t', 3)
+                if len(parts) < 2:
+                    continue
+                # Check if package is installed (for dpkg, status is in the third column)
+                if len(parts) < 3 or 'installed' in parts[2]:
+                    append(_software_entry(parts[0], parts[1], 'Unknown', 'dpkg'))
+                    if limit and cap.reached(software):
+                        break
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return []
+        return software
+    
+    def _read_dpkg_status(self, path='/var/lib/dpkg/status', limit=0):
+        """
+        List installed packages from the dpkg status database directly,
+        the file dpkg-query would read, without starting dpkg-query.
         
-        # Also scan flatpak packages
+        Returns:
+            Package list as _scan_dpkg returns it, or None if the file
+            cannot be read or dpkg has unmerged updates pending
+        """
         try:
-            result = subprocess.run(
-                ['flatpak', 'list', '--columns=application,version'],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split('\t')
-                    if len(parts) >= 1:
-                        software.append({
-                            'name': parts[0],
-                            'version': parts[1] if len(parts) > 1 else 'Unknown',
-                            'vendor': 'Flathub',
-                            'type': 'flatpak',
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired):
+            # Records of an interrupted dpkg run that dpkg-query would merge in
+            if os.listdir(os.path.join(os.path.dirname(path), 'updates')):
+                return None
+        except OSError:
             pass
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
         
+        # (name, version) pairs; the dictionaries are built once sorted
+        packages = []
+        append = packages.append
+        find_fields = _DPKG_FIELD_RE.finditer
+        for paragraph in data.split(b'\n\n'):
+            fields = dict(match.groups() for match in find_fields(paragraph))
+            package = fields.get(b'Package')
+            status = fields.get(b'Status', b'')
+            # dpkg-query -W leaves out not-installed packages; of the rest,
+            # keep those whose state mentions 'installed' as _scan_dpkg does
+            if not package or b'installed' not in status or status.endswith(b' not-installed'):
+                continue
+            append((
+                package.decode('utf-8', 'replace'),
+                fields.get(b'Version', b'').decode('utf-8', 'replace'),
+            ))
+        
+        # dpkg-query lists packages by name
+        packages.sort(key=itemgetter(0))
+        if not limit:
+            return [_software_entry(name, version, 'Unknown', 'dpkg') for name, version in packages]
+        
+        software = []
+        cap = _PackageCap(limit, self.dedup)
+        for name, version in packages:
+            software.append(_software_entry(name, version, 'Unknown', 'dpkg'))
+            if cap.reached(software):
+                break
+        return software
+    
+    def _scan_rpm(self, limit=0):
+        """List installed rpm (Red Hat/CentOS/Fedora) packages, at most limit if set."""
+        software = []
+        # Without the command installed there is nothing to start
+        if not _which('rpm'):
+            return software
+        cap = _PackageCap(limit, self.dedup)
+        try:
+            append = software.append
+            for line in iter_lines(['rpm', '-qa', '--queryformat', '%{NAME}\t%{VERSION}\t%{VENDOR}\n'], 60, check=True):
+                if line:
+                    parts = line.split('\t', 3)
+                    append(_software_entry(
+                        parts[0],
+                        parts[1] if len(parts) > 1 else 'Unknown',
+                        parts[2] if len(parts) > 2 else 'Unknown',
+                        'rpm'
+                    ))
+                    if limit and cap.reached(software):
+                        break
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return []
+        return software
+    
+    def _scan_snap(self, limit=0):
+        """List installed snap packages, at most limit if set."""
+        software = []
+        if not _which('snap'):
+            return software
+        cap = _PackageCap(limit, self.dedup)
+        try:
+            append = software.append
+            lines = iter_lines(['snap', 'list'], 30, check=True)
+            next(lines, None)  # Skip header
+            for line in lines:
+                parts = line.split(None, 2)
+                if len(parts) >= 2:
+                    append(_software_entry(parts[0], parts[1], 'Snap Store', 'snap'))
+                    if limit and cap.reached(software):
+                        break
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return []
+        return software
+    
+    def _scan_flatpak(self, limit=0):
+        """List installed flatpak applications, at most limit if set."""
+        software = []
+        if not _which('flatpak'):
+            return software
+        cap = _PackageCap(limit, self.dedup)
+        try:
+            append = software.append
+            for line in iter_lines(['flatpak', 'list', '--columns=application,version'], 30, check=True):
+                parts = line.split('\t', 3)
+                if parts[0]:
+                    append(_software_entry(parts[0], parts[1] if len(parts) > 1 else 'Unknown', 'Flathub', 'flatpak'))
+                    if limit and cap.reached(software):
+                        break
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return []
         return software
     
-    def _scan_windows(self):
+    def _scan_windows(self, limit=0):
         """Scan installed software on Windows systems."""
+        if WINREG_AVAILABLE:
+            return self._cached_scan('windows', self._scan_uninstall_keys, limit)
+        return self._scan_uninstall_keys_powershell(limit)
+    
+    def _open_uninstall_key(self, hive, path):
+        """
+        Open one of UNINSTALL_KEYS for reading. The 64-bit view is
+        requested so that a 32-bit Python is not redirected to WOW6432Node.
+        """
+        return winreg.OpenKey(
+            getattr(winreg, hive), path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+        )
+    
+    def _scan_uninstall_keys(self, limit=0):
+        """
+        List the programs registered in the Uninstall registry keys,
+        reading the registry directly instead of through PowerShell.
+        """
+        software = []
+        append = software.append
+        cap = _PackageCap(limit, self.dedup)
+        enum_key, open_key, query_value = winreg.EnumKey, winreg.OpenKey, winreg.QueryValueEx
+        for hive, path in self.UNINSTALL_KEYS:
+            try:
+                key = self._open_uninstall_key(hive, path)
+            except OSError:
+                continue
+            with key:
+                index = 0
+                while True:
+                    try:
+                        name = enum_key(key, index)
+                    except OSError:
+                        break  # No more subkeys
+                    index += 1
+                    # Unreadable entries are skipped, like PowerShell's SilentlyContinue
+                    try:
+                        with open_key(key, name) as subkey:
+                            values = {}
+                            for value_name in ('DisplayName', 'DisplayVersion', 'Publisher'):
+                                try:
+                                    values[value_name] = str(query_value(subkey, value_name)[0])
+                                except OSError:
+                                    values[value_name] = ''
+                    except OSError:
+                        continue
+                    if values['DisplayName']:
+                        append(_software_entry(
+                            values['DisplayName'], values['DisplayVersion'], values['Publisher'], 'windows'
+                        ))
+                        if limit and cap.reached(software):
+                            return software
+        return software
+    
+    def _scan_uninstall_keys_powershell(self, limit=0):
+        """
+        List the programs registered in the Uninstall registry keys with
+        PowerShell, where the winreg module is unavailable.
+        """
         software = []
+        cap = _PackageCap(limit, self.dedup)
         
         try:
-            # Use PowerShell to get installed programs with error handling
-            # Try-Catch handles permission issues when accessing registry
-            ps_script = '''
-            $ErrorActionPreference = "SilentlyContinue"
-            try {
-                Get-ItemProperty HKLM:\\Software\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* -ErrorAction SilentlyContinue |
-                Select-Object DisplayName, DisplayVersion, Publisher |
-                Where-Object {$_.DisplayName -ne $null} |
-                ForEach-Object { "$($_.DisplayName)`t$($_.DisplayVersion)`t$($_.Publisher)" }
-            } catch {
-                # Silently handle permission errors
-            }
-            try {
-                Get-ItemProperty HKLM:\\Software\\WOW6432Node\\Microsoft\\Windows\\CurrentVersion\\Uninstall\\* -ErrorAction SilentlyContinue |
-                Select-Object DisplayName, DisplayVersion, Publisher |
-                Where-Object {$_.DisplayName -ne $null} |
-                ForEach-Object { "$($_.DisplayName)`t$($_.DisplayVersion)`t$($_.Publisher)" }
-            } catch {
-                # Silently handle permission errors
-            }
-            '''
-            
-            result = subprocess.run(
-                ['powershell', '-Command', ps_script],
-                capture_output=True, text=True, timeout=120
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split('\t')
-                    if len(parts) >= 1 and parts[0]:
-                        software.append({
-                            'name': parts[0],
-                            'version': parts[1] if len(parts) > 1 else 'Unknown',
-                            'vendor': parts[2] if len(parts) > 2 else 'Unknown',
-                            'type': 'windows',
-                        })
+            # PowerShell 7 (pwsh) starts faster where installed; skipping the
+            # user's profile and interactive setup saves more start-up time
+            command = [
+                _which('pwsh') or 'powershell',
+                '-NoProfile', '-NonInteractive', '-OutputFormat', 'Text',
+                '-Command', self._powershell_script(),
+            ]
+            append = software.append
+            source_types = self.POWERSHELL_SOURCE_TYPES
+            for line in iter_lines(command, 120, check=True):
+                # Rows are "<source>`t<name>`t<version>`t<publisher>"
+                parts = line.split('\t', 3)
+                source_type = source_types.get(parts[0])
+                if source_type and len(parts) > 1 and parts[1]:
+                    append(_software_entry(
+                        parts[1],
+                        parts[2] if len(parts) > 2 else 'Unknown',
+                        parts[3] if len(parts) > 3 else 'Unknown',
+                        source_type
+                    ))
+                    if limit and cap.reached(software):
+                        break
+        except subprocess.CalledProcessError:
+            software = []
         except (FileNotFoundError, subprocess.TimeoutExpired, PermissionError):
-            software.append({'error': 'Unable to scan Windows software'})
+            software = [{'error': 'Unable to scan Windows software'}]
         
         return software
     
-    def _scan_macos(self):
-        """Scan installed software on macOS systems."""
-        software = []
-        
-        try:
-            # Get applications from /Applications
-            result = subprocess.run(
-                ['ls', '/Applications'],
-                capture_output=True, text=True, timeout=30
-            )
-            if result.returncode == 0:
-                for app in result.stdout.strip().split('\n'):
-                    if app.endswith('.app'):
-                        app_name = app.replace('.app', '')
-                        software.append({
-                            'name': app_name,
-                            'version': 'Unknown',
-                            'vendor': 'Unknown',
-                            'type': 'macos_app',
-                        })
-            
-            # Get brew packages if available
-            result = subprocess.run(
-                ['brew', 'list', '--versions'],
-                capture_output=True, text=True, timeout=60
+    def _powershell_script(self):
+        """
+        Build one PowerShell script that lists every source, so PowerShell
+        (whose startup dominates) is started once however many there are.
+        Each row is tagged with its source for POWERSHELL_SOURCE_TYPES.
+        """
+        blocks = ['$ErrorActionPreference = "SilentlyContinue"']
+        for hive, path in self.UNINSTALL_KEYS:
+            drive = self.POWERSHELL_DRIVES[hive]
+            # Try-Catch handles permission issues when accessing registry
+            blocks.append(
+                'try {\n'
+                f'    Get-ItemProperty {drive}:\\{path}\\* -ErrorAction SilentlyContinue |\n'
+                '    Where-Object {$_.DisplayName -ne $null} |\n'
+                '    ForEach-Object { "uninstall`t$($_.DisplayName)`t$($_.DisplayVersion)`t$($_.Publisher)" }\n'
+                '} catch {\n'
+                '    # Silently handle permission errors\n'
+                '}'
             )
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        software.append({
-                            'name': parts[0],
-                            'version': parts[1],
-                            'vendor': 'Homebrew',
-                            'type': 'brew',
-                        })
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+        return '\n'.join(blocks)
+    
+    def _iter_macos(self, executor=None, limit=0):
+        """Yield installed software on macOS systems."""
+        # Applications and Homebrew packages are listed at the same time
+        with self._probe_executor(executor) as executor:
+            apps = executor.submit(self._cached_scan, 'macos_apps', self._scan_macos_apps, limit)
+            brew = executor.submit(self._scan_brew, limit)
+            yield from apps.result()
+            yield from brew.result()
+    
+    def _list_applications(self, path='/Applications'):
+        """
+        Return the sorted names of the application bundles in path, or None
+        if it cannot be listed. Hidden entries are skipped, as ls does.
+        """
+        try:
+            with os.scandir(path) as entries:
+                return sorted(
+                    entry.name for entry in entries
+                    if entry.name.endswith('.app') and not entry.name.startswith('.')
+                )
+        except OSError:
+            return None
+    
+    def _applications_stamp(self, path='/Applications'):
+        """
+        Return the applications in path with the modification times of
+        their Info.plist files, which change when an application is updated
+        in place, or None if path cannot be listed.
+        """
+        names = self._list_applications(path)
+        if names is None:
+            return None
+        
+        stamp = []
+        for name in names:
+            try:
+                mtime = os.stat(os.path.join(path, name, 'Contents', 'Info.plist')).st_mtime_ns
+            except OSError:
+                mtime = None
+            stamp.append([name, mtime])
+        return stamp
+    
+    def _scan_macos_apps(self, limit=0, path='/Applications'):
+        """List applications in /Applications with their bundle versions."""
+        # Listing the directory directly spares starting ls
+        names = self._list_applications(path)
+        if not names:
+            return []
+        if limit:
+            # Bundle names are unique, so no application is a duplicate
+            names = names[:limit]
+        
+        # Each Info.plist read mostly waits on the disk, so they overlap
+        workers = min(32, (os.cpu_count() or 1) * 4, len(names))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            versions = list(executor.map(
+                self._read_bundle_version, [os.path.join(path, name) for name in names]
+            ))
         
+        return [
+            _software_entry(name.replace('.app', ''), version, 'Unknown', 'macos_app')
+            for name, version in zip(names, versions)
+        ]
+    
+    def _read_bundle_version(self, bundle_path):
+        """Return an application bundle's version from its Info.plist, or 'Unknown'."""
+        try:
+            with open(os.path.join(bundle_path, 'Contents', 'Info.plist'), 'rb') as f:
+                info = plistlib.load(f)
+        except Exception:
+            return 'Unknown'  # Missing, unreadable or malformed
+        if not isinstance(info, dict):
+            return 'Unknown'
+        version = info.get('CFBundleShortVersionString') or info.get('CFBundleVersion')
+        return str(version).strip() if version else 'Unknown'
+    
+    def _scan_brew(self, limit=0):
+        """List Homebrew packages, if Homebrew is installed, at most limit if set."""
+        software = []
+        if not _which('brew'):
+            return software
+        cap = _PackageCap(limit, self.dedup)
+        try:
+            append = software.append
+            for line in iter_lines(['brew', 'list', '--versions'], 60, check=True):
+                parts = line.split(None, 2)
+                if len(parts) >= 2:
+                    append(_software_entry(parts[0], parts[1], 'Homebrew', 'brew'))
+                    if limit and cap.reached(software):
+                        break
+        except (FileNotFoundError, subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            return []
         return software
     
     def get_info(self):
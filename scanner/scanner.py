@@ -7,13 +7,40 @@ converts to CPE format, and exports to Excel.
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from modules import OSScanner, HardwareScanner, SoftwareScanner
+from modules import OSScanner, HardwareScanner
 from cpe_converter import CPEConverter
 from excel_exporter import ExcelExporter
 
 
+def scan_software(software_scanner, cpe_converter, limit=0, executor=None):
+    """
+    Scan installed software and convert each package to CPE format as it
+    is found, so conversion overlaps with the package managers still running.
+    
+    Args:
+        software_scanner: SoftwareScanner instance
+        cpe_converter: CPEConverter instance
+        limit: Maximum number of software items to include (0 = no limit)
+        executor: Worker pool for the package manager probes
+    
+    Returns:
+        Tuple of (software list, list of software CPEEntry tuples)
+    """
+    software_list = []
+    
+    def collect(software_iter):
+        for software in software_iter:
+            software_list.append(software)
+            yield software
+    
+    software_iter = software_scanner.iter_scan(executor, limit)
+    software_cpe = list(cpe_converter.convert_software_iter(collect(software_iter)))
+    return software_list, software_cpe
+
+
 def main():
     """Main function to run the system scanner."""
     parser = argparse.ArgumentParser(
@@ -45,6 +72,16 @@ def main():
         default=0,
         help='Limit the number of software items to include (0 = no limit)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query the package managers instead of reusing cached package lists'
+    )
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Keep software listed more than once with the same name and version'
+    )
     
     args = parser.parse_args()
     
@@ -53,51 +90,77 @@ def main():
     print("=" * 60)
     print()
     
-    # Initialize scanners
+    # Initialize scanners. The scans wait on independent commands and
+    # files, so they run at once; results are reported in order as each one
+    # is needed. They share one pool with the hardware sections and
+    # software probes they start, sized so that every one of those tasks
+    # has a worker while the scans wait on them.
     os_scanner = OSScanner()
     hardware_scanner = HardwareScanner()
-    software_scanner = SoftwareScanner()
-    
-    # Scan OS
-    print("[1/4] Scanning Operating System...")
-    os_info = os_scanner.scan()
-    if args.verbose:
-        print(f"      System: {os_info.get('system', 'Unknown')}")
-        print(f"      Release: {os_info.get('release', 'Unknown')}")
-        print(f"      Platform: {os_info.get('platform', 'Unknown')}")
-    print("      Done!")
+    cpe_converter = CPEConverter()
+    workers = 2 + HardwareScanner.SECTION_WORKERS
     
-    # Scan Hardware
-    print("\n[2/4] Scanning Hardware...")
-    hardware_info = hardware_scanner.scan()
-    if args.verbose:
-        cpu = hardware_info.get('cpu', {})
-        print(f"      CPU: {cpu.get('model', cpu.get('processor', 'Unknown'))}")
-        memory = hardware_info.get('memory', {})
-        print(f"      Memory: {memory.get('total_gb', 'Unknown')} GB")
-        print(f"      Disks: {len(hardware_info.get('disks', []))} partition(s)")
-    print("      Done!")
+    software_scanner = None
+    if not args.skip_software:
+        # Imported only when used, so --skip-software does not load it
+        from modules import SoftwareScanner
+        software_scanner = SoftwareScanner(use_cache=not args.no_cache, dedup=not args.no_dedup)
+        workers += 1 + SoftwareScanner.PROBE_WORKERS
     
-    # Scan Software
-    if args.skip_software:
-        print("\n[3/4] Skipping Software Scan (--skip-software)")
-        software_list = []
-    else:
-        print("\n[3/4] Scanning Installed Software...")
-        print("      (This may take a while...)")
-        software_list = software_scanner.scan()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scan') as executor:
+        os_future = executor.submit(os_scanner.scan)
+        hardware_future = executor.submit(hardware_scanner.scan, executor=executor)
+        software_future = None if software_scanner is None else executor.submit(
+            scan_software, software_scanner, cpe_converter, args.limit_software, executor
+        )
         
-        if args.limit_software > 0:
-            software_list = software_list[:args.limit_software]
+        # Scan OS
+        print("[1/4] Scanning Operating System...")
+        os_info = os_future.result()
+        if args.verbose:
+            print(f"      System: {os_info.get('system', 'Unknown')}")
+            print(f"      Release: {os_info.get('release', 'Unknown')}")
+            print(f"      Platform: {os_info.get('platform', 'Unknown')}")
+        print("      Done!")
         
+        # Scan Hardware
+        print("\n[2/4] Scanning Hardware...")
+        hardware_info = hardware_future.result()
+        if hardware_scanner.timed_out_sections:
+            # Rerun what the short default timeouts cut off, with long ones
+            if args.verbose:
+                print(f"      Timed out: {', '.join(sorted(hardware_scanner.timed_out))}")
+                print(f"      Retrying {', '.join(sorted(hardware_scanner.timed_out_sections))} with longer timeouts...")
+            hardware_info = hardware_scanner.rescan_timed_out(executor)
+            if hardware_scanner.timed_out_sections:
+                print(f"      Warning: incomplete after timeouts: "
+                      f"{', '.join(sorted(hardware_scanner.timed_out_sections))}")
         if args.verbose:
-            print(f"      Found {len(software_list)} software package(s)")
+            cpu = hardware_info.get('cpu', {})
+            print(f"      CPU: {cpu.get('model', cpu.get('processor', 'Unknown'))}")
+            memory = hardware_info.get('memory', {})
+            total_bytes = memory.get('total_bytes')
+            total_gb = round(total_bytes / (1 << 30), 2) if total_bytes is not None else 'Unknown'
+            print(f"      Memory: {total_gb} GB")
+            print(f"      Disks: {len(hardware_info.get('disks', []))} partition(s)")
         print("      Done!")
+        
+        # Scan Software
+        if software_future is None:
+            print("\n[3/4] Skipping Software Scan (--skip-software)")
+            software_list, software_cpe = [], []
+        else:
+            print("\n[3/4] Scanning Installed Software...")
+            print("      (This may take a while...)")
+            software_list, software_cpe = software_future.result()
+            
+            if args.verbose:
+                print(f"      Found {len(software_list)} software package(s)")
+            print("      Done!")
     
     # Convert to CPE format
     print("\n[4/4] Converting to CPE Format...")
-    cpe_converter = CPEConverter()
-    cpe_data = cpe_converter.convert_all(os_info, hardware_info, software_list)
+    cpe_data = cpe_converter.convert_all(os_info, hardware_info, software_list, software_cpe)
     if args.verbose:
         print(f"      Generated {len(cpe_data)} CPE entries")
     print("      Done!")
@@ -122,8 +185,8 @@ def main():
     print("  Summary")
     print("=" * 60)
     print(f"  Operating System:    {os_info.get('platform', 'Unknown')}")
-    print(f"  Hardware Components: {len([item for item in cpe_data if 'Hardware' in item.get('type', '')])}")
-    print(f"  Software Packages:   {len([item for item in cpe_data if 'Software' in item.get('type', '')])}")
+    print(f"  Hardware Components: {len([item for item in cpe_data if 'Hardware' in item.type])}")
+    print(f"  Software Packages:   {len([item for item in cpe_data if 'Software' in item.type])}")
     print(f"  Total CPE Entries:   {len(cpe_data)}")
     print("=" * 60)
     